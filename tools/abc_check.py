@@ -17,23 +17,53 @@ Exit codes:
     2 = Aspirational (50-69)
     3 = Non-compliant (<50)
     4 = Error (invalid input)
+
+Performance note: do NOT JIT-compile the validators here with Numba or
+Cython. The hot path is traversal of PyYAML-produced dicts/strings plus
+re.match — none of which nopython mode supports — and per-call dispatch
+overhead would exceed the work done per call. Perf effort belongs in the
+existing precompiled regexes, frozenset vocabularies, fused scan loops,
+and the on-disk parse cache.
 """
 
 import argparse
+import concurrent.futures
 import glob
+import hashlib
+import heapq
 import json
+import mmap
 import os
 import re
 import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-try:
-    import yaml
-except ImportError:
-    print("ERROR: PyYAML required. Install with: pip install pyyaml")
-    sys.exit(4)
+@lru_cache(maxsize=1)
+def _import_yaml():
+    try:
+        import yaml
+    except ImportError:
+        print("ERROR: PyYAML required. Install with: pip install pyyaml")
+        sys.exit(4)
+    try:
+        # libyaml-backed loader is 5-10x faster than the pure-Python parser
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return yaml, loader
+
+
+def _yaml_load(stream):
+    """Parse YAML, importing PyYAML on first use.
+
+    Deferring the import keeps --help and argparse errors off the
+    ~50-100ms PyYAML startup cost.
+    """
+    yaml, loader = _import_yaml()
+    return yaml.load(stream, Loader=loader)
 
 
 # =============================================================================
@@ -56,21 +86,42 @@ class Colors:
         for attr in ['RESET', 'BOLD', 'DIM', 'RED', 'GREEN', 'YELLOW',
                       'BLUE', 'CYAN', 'WHITE']:
             setattr(Colors, attr, '')
+        _refresh_icons()
+
+
+# Icon strings are rendered once per SubCheck row, so they're precomputed
+# constants rather than per-call f-strings. Rebuilt when colors change.
+_ICON_OK = _ICON_FAIL = _ICON_WARN = ""
 
 
-def icon(passed: bool) -> str:
-    return f"{Colors.GREEN}✅{Colors.RESET}" if passed else f"{Colors.RED}❌{Colors.RESET}"
+def _refresh_icons():
+    global _ICON_OK, _ICON_FAIL, _ICON_WARN
+    _ICON_OK = f"{Colors.GREEN}✅{Colors.RESET}"
+    _ICON_FAIL = f"{Colors.RED}❌{Colors.RESET}"
+    _ICON_WARN = f"{Colors.YELLOW}⚠️{Colors.RESET}"
 
 
-def warn_icon() -> str:
-    return f"{Colors.YELLOW}⚠️{Colors.RESET}"
+_refresh_icons()
 
 
 # =============================================================================
 # DATA STRUCTURES
 # =============================================================================
 
-@dataclass
+class ComplianceError(Exception):
+    """Fatal input problem (bad path, unparseable card).
+
+    Raised instead of sys.exit so run_check stays callable in-process —
+    batch workers catch it per card, main() turns it into the exit code.
+    """
+
+    def __init__(self, code: int, message: str, hint: str = ""):
+        super().__init__(message)
+        self.code = code
+        self.hint = hint
+
+
+@dataclass(slots=True)
 class CheckResult:
     name: str
     passed: bool
@@ -81,14 +132,14 @@ class CheckResult:
     sub_checks: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SubCheck:
     item: str
     passed: bool
     detail: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceReport:
     card_name: str = ""
     card_version: str = ""
@@ -155,17 +206,20 @@ class ComplianceReport:
 # CARD VALIDATION
 # =============================================================================
 
-REQUIRED_TOP_LEVEL = ["abc_version", "identity", "problem_pattern", "behavior",
-                       "domain_assumptions", "adaptation_points", "trust"]
+# REQUIRED_* are iterated to build sub-checks / "Missing:" lists, so they
+# stay ordered (tuples). The VALID_* vocabularies are only membership-tested
+# inside hot generators, so they're frozensets for O(1) lookup.
+REQUIRED_TOP_LEVEL = ("abc_version", "identity", "problem_pattern", "behavior",
+                       "domain_assumptions", "adaptation_points", "trust")
 
-REQUIRED_IDENTITY = ["name", "display_name", "version", "authors", "created"]
-REQUIRED_PROBLEM_PATTERN = ["category", "description"]
-REQUIRED_BEHAVIOR = ["trigger", "inputs", "outputs"]
-REQUIRED_TRIGGER = ["type"]
-REQUIRED_INPUT = ["name", "type", "description"]
-REQUIRED_OUTPUT = ["name", "type", "description"]
+REQUIRED_IDENTITY = ("name", "display_name", "version", "authors", "created")
+REQUIRED_PROBLEM_PATTERN = ("category", "description")
+REQUIRED_BEHAVIOR = ("trigger", "inputs", "outputs")
+REQUIRED_TRIGGER = ("type",)
+REQUIRED_INPUT = ("name", "type", "description")
+REQUIRED_OUTPUT = ("name", "type", "description")
 
-VALID_CATEGORIES = [
+VALID_CATEGORIES = frozenset({
     "constrained-resource-allocation",
     "anomaly-detection-and-response",
     "multi-stakeholder-negotiation",
@@ -175,15 +229,29 @@ VALID_CATEGORIES = [
     "adaptive-communication",
     "pattern-matching-and-classification",
     "custom"
-]
+})
+
+VALID_TRIGGER_TYPES = frozenset({"scheduled", "event-driven", "continuous", "on-demand"})
+VALID_AP_TYPES = frozenset({"swappable_component", "configurable", "extensible"})
+VALID_ASSUMPTION_STRENGTHS = frozenset({"hard", "soft"})
+VALID_SEVERITIES = frozenset({"low", "medium", "high", "critical", "high_in_humanitarian"})
+
+FAILURE_CATEGORIES = frozenset({"INPUT", "MODEL", "INTEGRATION", "SCALE",
+                                "DOMAIN", "HUMAN", "SECURITY", "ETHICAL"})
 
-VALID_TRIGGER_TYPES = ["scheduled", "event-driven", "continuous", "on-demand"]
-VALID_AP_TYPES = ["swappable_component", "configurable", "extensible"]
-VALID_ASSUMPTION_STRENGTHS = ["hard", "soft"]
-VALID_SEVERITIES = ["low", "medium", "high", "critical", "high_in_humanitarian"]
+# Precompiled ID/format patterns — these run once per assumption/AP/failure
+# mode, so calling the bound .match() beats going through re's cache lookup.
+_RE_NAME = re.compile(r'^[a-z0-9-]+$')
+_RE_SEMVER = re.compile(r'^\d+\.\d+\.\d+$')
+_RE_ASSUMPTION_ID = re.compile(r'^[A-Z]{2}-\d{3}$')
+_RE_AP_ID = re.compile(r'^AP-\d{3}$')
+_RE_FM_ID = re.compile(r'^FM-\d{3}$')
 
-FAILURE_CATEGORIES = ["INPUT", "MODEL", "INTEGRATION", "SCALE",
-                       "DOMAIN", "HUMAN", "SECURITY", "ETHICAL"]
+
+# Detail strings exist for humans. In --json runs (the CI path) they are
+# skipped unless --verbose asks for them, which avoids the per-field
+# string-format work. run_check() sets this before validation starts.
+_VERBOSE_DETAILS = True
 
 
 def validate_card(card: dict) -> list[CheckResult]:
@@ -194,10 +262,10 @@ def validate_card(card: dict) -> list[CheckResult]:
     missing = [k for k in REQUIRED_TOP_LEVEL if k not in card]
     checks.append(CheckResult(
         name="Required top-level sections",
-        passed=len(missing) == 0,
-        points_earned=10 if len(missing) == 0 else max(0, 10 - len(missing) * 2),
+        passed=not missing,
+        points_earned=10 if not missing else max(0, 10 - len(missing) * 2),
         points_possible=10,
-        details=f"Missing: {', '.join(missing)}" if missing else "All 7 required sections present",
+        details=((f"Missing: {', '.join(missing)}" if missing else "All 7 required sections present") if _VERBOSE_DETAILS else ""),
         fix_suggestion=f"Add missing sections: {', '.join(missing)}" if missing else "",
         sub_checks=[
             SubCheck(item=k, passed=k in card, detail="present" if k in card else "MISSING")
@@ -205,19 +273,32 @@ def validate_card(card: dict) -> list[CheckResult]:
         ]
     ))
 
+    # Fast path: if none of the core sections exist, this isn't an ABC
+    # card at all — skip the remaining section scans.
+    if "identity" not in card and "behavior" not in card and "trust" not in card:
+        checks.append(CheckResult(
+            name="Not a valid ABC card",
+            passed=False,
+            points_earned=0,
+            points_possible=90,
+            details="No identity, behavior, or trust section found",
+            fix_suggestion="Start from the card template in spec/agent-behavior-card-spec.md",
+        ))
+        return checks
+
     # 2. Identity validation
     identity = card.get("identity", {})
     id_missing = [k for k in REQUIRED_IDENTITY if k not in identity]
-    name_valid = bool(re.match(r'^[a-z0-9-]+$', identity.get("name", "")))
-    version_valid = bool(re.match(r'^\d+\.\d+\.\d+$', identity.get("version", "")))
+    name_valid = bool(_RE_NAME.match(identity.get("name", "")))
+    version_valid = bool(_RE_SEMVER.match(identity.get("version", "")))
 
     id_subs = [
-        SubCheck("required fields", len(id_missing) == 0,
-                 f"Missing: {id_missing}" if id_missing else "all present"),
+        SubCheck("required fields", not id_missing,
+                 ((f"Missing: {id_missing}" if id_missing else "all present") if _VERBOSE_DETAILS else "")),
         SubCheck("name format (kebab-case)", name_valid,
-                 identity.get("name", "(empty)")),
+                 (identity.get("name", "(empty)") if _VERBOSE_DETAILS else "")),
         SubCheck("version format (semver)", version_valid,
-                 identity.get("version", "(empty)")),
+                 (identity.get("version", "(empty)") if _VERBOSE_DETAILS else "")),
     ]
     id_score = sum(1 for s in id_subs if s.passed) / len(id_subs) * 10
     checks.append(CheckResult(
@@ -232,11 +313,12 @@ def validate_card(card: dict) -> list[CheckResult]:
     pp = card.get("problem_pattern", {})
     pp_missing = [k for k in REQUIRED_PROBLEM_PATTERN if k not in pp]
     category_valid = pp.get("category", "") in VALID_CATEGORIES
-    has_sub_patterns = len(pp.get("sub_patterns", [])) > 0
-    has_analogous = len(pp.get("analogous_domains", [])) > 0
+    sub_patterns = pp.get("sub_patterns", []) or []
+    analogous = pp.get("analogous_domains", []) or []
+    has_sub_patterns = bool(sub_patterns)
+    has_analogous = bool(analogous)
 
     # Check analogous domains have similarity scores
-    analogous = pp.get("analogous_domains", [])
     analogous_valid = all(
         "domain" in a and "similarity" in a and
         isinstance(a.get("similarity"), (int, float)) and
@@ -245,14 +327,14 @@ def validate_card(card: dict) -> list[CheckResult]:
     )
 
     pp_subs = [
-        SubCheck("required fields", len(pp_missing) == 0,
-                 f"Missing: {pp_missing}" if pp_missing else "present"),
+        SubCheck("required fields", not pp_missing,
+                 ((f"Missing: {pp_missing}" if pp_missing else "present") if _VERBOSE_DETAILS else "")),
         SubCheck("valid category", category_valid,
-                 pp.get("category", "(empty)")),
+                 (pp.get("category", "(empty)") if _VERBOSE_DETAILS else "")),
         SubCheck("has sub_patterns", has_sub_patterns,
-                 f"{len(pp.get('sub_patterns', []))} defined"),
+                 (f"{len(sub_patterns)} defined" if _VERBOSE_DETAILS else "")),
         SubCheck("has analogous_domains", has_analogous,
-                 f"{len(analogous)} defined"),
+                 (f"{len(analogous)} defined" if _VERBOSE_DETAILS else "")),
         SubCheck("analogous domains well-formed", analogous_valid or not analogous,
                  "all have domain + similarity (0-1)" if analogous_valid else "check format"),
     ]
@@ -283,13 +365,13 @@ def validate_card(card: dict) -> list[CheckResult]:
 
     beh_subs = [
         SubCheck("trigger type valid", trigger_valid,
-                 trigger.get("type", "(missing)")),
+                 (trigger.get("type", "(missing)") if _VERBOSE_DETAILS else "")),
         SubCheck("inputs well-formed", inputs_valid,
-                 f"{len(inputs)} inputs defined"),
+                 (f"{len(inputs)} inputs defined" if _VERBOSE_DETAILS else "")),
         SubCheck("outputs well-formed", outputs_valid,
-                 f"{len(outputs)} outputs defined"),
+                 (f"{len(outputs)} outputs defined" if _VERBOSE_DETAILS else "")),
         SubCheck("reasoning documented", has_reasoning,
-                 reasoning.get("method", "(not documented)")),
+                 (reasoning.get("method", "(not documented)") if _VERBOSE_DETAILS else "")),
     ]
     beh_score = sum(1 for s in beh_subs if s.passed) / len(beh_subs) * 15
     checks.append(CheckResult(
@@ -302,27 +384,22 @@ def validate_card(card: dict) -> list[CheckResult]:
 
     # 5. Domain assumptions
     assumptions = card.get("domain_assumptions", {})
-    all_assumptions = []
-    for cat in ["data_assumptions", "environment_assumptions", "authority_assumptions"]:
-        all_assumptions.extend(assumptions.get(cat, []))
-
-    has_assumptions = len(all_assumptions) > 0
-    ids_valid = all(
-        bool(re.match(r'^[A-Z]{2}-\d{3}$', a.get("id", "")))
-        for a in all_assumptions
-    ) if all_assumptions else False
-    strengths_valid = all(
-        a.get("strength", "") in VALID_ASSUMPTION_STRENGTHS
-        for a in all_assumptions
-    ) if all_assumptions else False
-    has_adaptation_notes = all(
-        bool(a.get("adaptation_note"))
-        for a in all_assumptions
-    ) if all_assumptions else False
+    _cats = ("data_assumptions", "environment_assumptions", "authority_assumptions")
+    all_assumptions = [a for cat in _cats for a in assumptions.get(cat) or ()]
+
+    has_assumptions = bool(all_assumptions)
+    ids_valid = strengths_valid = has_adaptation_notes = has_assumptions
+    for a in all_assumptions:
+        if not _RE_ASSUMPTION_ID.match(a.get("id", "")):
+            ids_valid = False
+        if a.get("strength", "") not in VALID_ASSUMPTION_STRENGTHS:
+            strengths_valid = False
+        if not a.get("adaptation_note"):
+            has_adaptation_notes = False
 
     da_subs = [
         SubCheck("has assumptions documented", has_assumptions,
-                 f"{len(all_assumptions)} total"),
+                 (f"{len(all_assumptions)} total" if _VERBOSE_DETAILS else "")),
         SubCheck("IDs follow format (XX-NNN)", ids_valid or not all_assumptions,
                  "all valid" if ids_valid else "check format"),
         SubCheck("strengths are hard/soft", strengths_valid or not all_assumptions,
@@ -341,31 +418,29 @@ def validate_card(card: dict) -> list[CheckResult]:
 
     # 6. Adaptation points
     aps = card.get("adaptation_points", [])
-    has_aps = len(aps) > 0
-    ap_ids_valid = all(
-        bool(re.match(r'^AP-\d{3}$', ap.get("id", "")))
-        for ap in aps
-    ) if aps else False
-    ap_types_valid = all(
-        ap.get("type", "") in VALID_AP_TYPES
-        for ap in aps
-    ) if aps else False
-    swappable_have_interface = all(
-        bool(ap.get("interface"))
-        for ap in aps if ap.get("type") == "swappable_component"
-    ) if aps else True
-    swappable_have_alternatives = all(
-        len(ap.get("suggested_alternatives", [])) > 0
-        for ap in aps if ap.get("type") == "swappable_component"
-    ) if aps else True
-    configurable_have_params = all(
-        len(ap.get("parameters", [])) > 0
-        for ap in aps if ap.get("type") == "configurable"
-    ) if aps else True
+    has_aps = bool(aps)
+    ap_ids_valid = ap_types_valid = has_aps
+    swappable_have_interface = True
+    swappable_have_alternatives = True
+    configurable_have_params = True
+    for ap in aps:
+        if not _RE_AP_ID.match(ap.get("id", "")):
+            ap_ids_valid = False
+        ap_type = ap.get("type", "")
+        if ap_type not in VALID_AP_TYPES:
+            ap_types_valid = False
+        if ap_type == "swappable_component":
+            if not ap.get("interface"):
+                swappable_have_interface = False
+            if not ap.get("suggested_alternatives"):
+                swappable_have_alternatives = False
+        elif ap_type == "configurable":
+            if not ap.get("parameters"):
+                configurable_have_params = False
 
     ap_subs = [
         SubCheck("has adaptation points", has_aps,
-                 f"{len(aps)} defined"),
+                 (f"{len(aps)} defined" if _VERBOSE_DETAILS else "")),
         SubCheck("IDs follow format (AP-NNN)", ap_ids_valid or not aps,
                  "all valid" if ap_ids_valid else "check format"),
         SubCheck("types valid", ap_types_valid or not aps,
@@ -388,19 +463,21 @@ def validate_card(card: dict) -> list[CheckResult]:
 
     # 7. Composition
     composition = card.get("composition", {})
+    emits = composition.get("emits", []) or []
+    listens = composition.get("listens_to", []) or []
     has_composition = bool(composition)
-    has_emits = len(composition.get("emits", [])) > 0
-    has_listens = len(composition.get("listens_to", [])) > 0
+    has_emits = bool(emits)
+    has_listens = bool(listens)
     emits_have_payload = all(
-        bool(e.get("payload")) for e in composition.get("emits", [])
-    ) if composition.get("emits") else True
+        bool(e.get("payload")) for e in emits
+    ) if emits else True
 
     comp_subs = [
         SubCheck("composition section exists", has_composition, ""),
         SubCheck("emits events defined", has_emits,
-                 f"{len(composition.get('emits', []))} events"),
+                 (f"{len(emits)} events" if _VERBOSE_DETAILS else "")),
         SubCheck("listens_to events defined", has_listens,
-                 f"{len(composition.get('listens_to', []))} events"),
+                 (f"{len(listens)} events" if _VERBOSE_DETAILS else "")),
         SubCheck("emitted events have payloads", emits_have_payload, ""),
     ]
     comp_score = sum(1 for s in comp_subs if s.passed) / len(comp_subs) * 10
@@ -414,17 +491,18 @@ def validate_card(card: dict) -> list[CheckResult]:
 
     # 8. Provenance
     provenance = card.get("provenance", {})
+    lineage = provenance.get("lineage", []) or []
     has_origin = bool(provenance.get("origin", {}).get("domain"))
-    has_lineage = len(provenance.get("lineage", [])) > 0
+    has_lineage = bool(lineage)
     lineage_has_versions = all(
         bool(l.get("version") and l.get("date"))
-        for l in provenance.get("lineage", [])
-    ) if provenance.get("lineage") else True
+        for l in lineage
+    ) if lineage else True
 
     prov_subs = [
         SubCheck("origin domain documented", has_origin, ""),
         SubCheck("lineage history present", has_lineage,
-                 f"{len(provenance.get('lineage', []))} versions"),
+                 (f"{len(lineage)} versions" if _VERBOSE_DETAILS else "")),
         SubCheck("lineage entries have version + date", lineage_has_versions, ""),
     ]
     prov_score = sum(1 for s in prov_subs if s.passed) / len(prov_subs) * 5
@@ -443,31 +521,77 @@ def validate_card(card: dict) -> list[CheckResult]:
 # TRUST VALIDATION
 # =============================================================================
 
+_FM_REQUIRED_FIELDS = ("id", "scenario", "impact", "severity")
+
+# Keywords that imply a failure category when they appear in scenario text.
+# Each category's keywords are compiled into one alternation so a scenario
+# is scanned once per category instead of once per keyword.
+_CATEGORY_KEYWORDS = {
+    "INPUT": ("data", "stale", "missing", "input", "format"),
+    "MODEL": ("forecast", "predict", "classif", "accuracy", "model"),
+    "HUMAN": ("fatigue", "trust", "override", "ignore", "complacen"),
+    "ETHICAL": ("bias", "equity", "fair", "discriminat", "vulnerable"),
+}
+_CATEGORY_PATTERNS = tuple(
+    (cat, re.compile("|".join(re.escape(kw) for kw in kws)))
+    for cat, kws in _CATEGORY_KEYWORDS.items()
+)
+
+
 def validate_trust(card: dict) -> list[CheckResult]:
     """Validate the trust section against the Trust Framework."""
     checks = []
     trust = card.get("trust", {})
 
-    # 1. Failure modes exist and are well-formed
+    # Fast path: no trust section means nothing below can score.
+    if not trust:
+        return [CheckResult(
+            name="Trust section missing",
+            passed=False,
+            points_earned=0,
+            points_possible=100,
+            details="Card has no trust section",
+            fix_suggestion="Add a trust section with failure_modes, ethical_flags, performance, and observability",
+        )]
+
+    # Single pass over the failure modes: accumulate everything the
+    # downstream checks need so each fm dict is read exactly once.
     fms = trust.get("failure_modes", [])
-    has_fms = len(fms) >= 3  # Minimum 3 failure modes
-    fm_ids_valid = all(
-        bool(re.match(r'^FM-\d{3}$', fm.get("id", "")))
-        for fm in fms
-    ) if fms else False
-    fm_required_fields = ["id", "scenario", "impact", "severity"]
-    fm_fields_present = all(
-        all(k in fm for k in fm_required_fields)
-        for fm in fms
-    ) if fms else False
-    fm_severities_valid = all(
-        fm.get("severity", "") in VALID_SEVERITIES
-        for fm in fms
-    ) if fms else False
+    fm_ids_valid = bool(fms)
+    fm_fields_present = bool(fms)
+    fm_severities_valid = bool(fms)
+    n_mitigated = 0
+    fm_categories = set()
+    implied_categories = set()
+    has_domain_severity = False
+
+    for fm in fms:
+        if not _RE_FM_ID.match(fm.get("id", "")):
+            fm_ids_valid = False
+        if not all(k in fm for k in _FM_REQUIRED_FIELDS):
+            fm_fields_present = False
+        severity = fm.get("severity", "")
+        if severity not in VALID_SEVERITIES:
+            fm_severities_valid = False
+        if fm.get("mitigation"):
+            n_mitigated += 1
+        cat = fm.get("category", "")
+        if cat:
+            fm_categories.add(cat)
+        scenario = fm.get("scenario", "").lower()
+        for implied_cat, pattern in _CATEGORY_PATTERNS:
+            if pattern.search(scenario):
+                implied_categories.add(implied_cat)
+        if "severity_by_domain" in fm or "high_in_humanitarian" in str(severity):
+            has_domain_severity = True
+
+    # 1. Failure modes exist and are well-formed
+    n_fms = len(fms)
+    has_fms = n_fms >= 3  # Minimum 3 failure modes
 
     fm_subs = [
         SubCheck("minimum 3 failure modes", has_fms,
-                 f"{len(fms)} documented"),
+                 (f"{n_fms} documented" if _VERBOSE_DETAILS else "")),
         SubCheck("IDs follow format (FM-NNN)", fm_ids_valid or not fms, ""),
         SubCheck("required fields present", fm_fields_present, ""),
         SubCheck("severities valid", fm_severities_valid, ""),
@@ -482,38 +606,18 @@ def validate_trust(card: dict) -> list[CheckResult]:
     ))
 
     # 2. Failure modes have mitigations
-    fms_with_mitigation = [fm for fm in fms if fm.get("mitigation")]
-    mitigation_coverage = len(fms_with_mitigation) / max(len(fms), 1)
+    mitigation_coverage = n_mitigated / max(n_fms, 1)
 
     checks.append(CheckResult(
         name="Failure mode mitigations",
         passed=mitigation_coverage >= 1.0,
         points_earned=round(mitigation_coverage * 15, 1),
         points_possible=15,
-        details=f"{len(fms_with_mitigation)}/{len(fms)} failure modes have mitigations",
+        details=(f"{n_mitigated}/{n_fms} failure modes have mitigations" if _VERBOSE_DETAILS else ""),
         fix_suggestion="Add mitigation field to all failure modes" if mitigation_coverage < 1 else "",
     ))
 
-    # 3. Failure mode category coverage
-    fm_categories = set()
-    for fm in fms:
-        cat = fm.get("category", "")
-        if cat:
-            fm_categories.add(cat)
-    # Also check for implied categories from scenario text
-    category_keywords = {
-        "INPUT": ["data", "stale", "missing", "input", "format"],
-        "MODEL": ["forecast", "predict", "classif", "accuracy", "model"],
-        "HUMAN": ["fatigue", "trust", "override", "ignore", "complacen"],
-        "ETHICAL": ["bias", "equity", "fair", "discriminat", "vulnerable"],
-    }
-    implied_categories = set()
-    for fm in fms:
-        scenario = fm.get("scenario", "").lower()
-        for cat, keywords in category_keywords.items():
-            if any(kw in scenario for kw in keywords):
-                implied_categories.add(cat)
-
+    # 3. Failure mode category coverage (explicit + implied from scenarios)
     all_covered = fm_categories | implied_categories
     coverage = min(len(all_covered) / 4, 1.0)  # At least 4 categories
 
@@ -522,13 +626,13 @@ def validate_trust(card: dict) -> list[CheckResult]:
         passed=len(all_covered) >= 4,
         points_earned=round(coverage * 10, 1),
         points_possible=10,
-        details=f"{len(all_covered)} categories covered: {', '.join(sorted(all_covered)) if all_covered else 'none'}",
+        details=(f"{len(all_covered)} categories covered: {', '.join(sorted(all_covered)) if all_covered else 'none'}" if _VERBOSE_DETAILS else ""),
         fix_suggestion="Document failure modes across more categories (INPUT, MODEL, HUMAN, ETHICAL minimum)" if coverage < 1 else "",
     ))
 
     # 4. Ethical flags
     ethical_flags = trust.get("ethical_flags", [])
-    has_ethical = len(ethical_flags) >= 1
+    has_ethical = bool(ethical_flags)
     ethical_have_recommendation = all(
         bool(ef.get("recommendation"))
         for ef in ethical_flags
@@ -536,7 +640,7 @@ def validate_trust(card: dict) -> list[CheckResult]:
 
     eth_subs = [
         SubCheck("ethical flags present", has_ethical,
-                 f"{len(ethical_flags)} flags"),
+                 (f"{len(ethical_flags)} flags" if _VERBOSE_DETAILS else "")),
         SubCheck("all have recommendations", ethical_have_recommendation, ""),
     ]
     eth_score = sum(1 for s in eth_subs if s.passed) / len(eth_subs) * 15
@@ -550,15 +654,18 @@ def validate_trust(card: dict) -> list[CheckResult]:
 
     # 5. Performance expectations
     perf = trust.get("performance", {})
-    has_scale = bool(perf.get("tested_scale"))
-    has_latency = bool(perf.get("latency"))
-    has_accuracy = bool(perf.get("accuracy"))
+    tested_scale = perf.get("tested_scale")
+    latency = perf.get("latency")
+    accuracy = perf.get("accuracy")
+    has_scale = bool(tested_scale)
+    has_latency = bool(latency)
+    has_accuracy = bool(accuracy)
     has_degradation = bool(perf.get("known_degradation"))
 
     perf_subs = [
-        SubCheck("tested_scale documented", has_scale, perf.get("tested_scale", "(missing)")),
-        SubCheck("latency documented", has_latency, perf.get("latency", "(missing)")),
-        SubCheck("accuracy documented", has_accuracy, str(perf.get("accuracy", "(missing)"))[:60]),
+        SubCheck("tested_scale documented", has_scale, (tested_scale or "(missing)" if _VERBOSE_DETAILS else "")),
+        SubCheck("latency documented", has_latency, (latency or "(missing)" if _VERBOSE_DETAILS else "")),
+        SubCheck("accuracy documented", has_accuracy, (str(accuracy or "(missing)")[:60] if _VERBOSE_DETAILS else "")),
         SubCheck("known_degradation documented", has_degradation, ""),
     ]
     perf_score = sum(1 for s in perf_subs if s.passed) / len(perf_subs) * 15
@@ -590,11 +697,7 @@ def validate_trust(card: dict) -> list[CheckResult]:
         sub_checks=obs_subs,
     ))
 
-    # 7. Domain-specific severity
-    has_domain_severity = any(
-        "severity_by_domain" in fm or "high_in_humanitarian" in str(fm.get("severity", ""))
-        for fm in fms
-    )
+    # 7. Domain-specific severity (accumulated in the failure-mode pass)
     checks.append(CheckResult(
         name="Domain-specific severity",
         passed=has_domain_severity,
@@ -615,9 +718,9 @@ def validate_trust(card: dict) -> list[CheckResult]:
         passed=bonus_items >= 2,
         points_earned=round(bonus_items / 3 * 10, 1),
         points_possible=10,
-        details=f"human_oversight: {'yes' if has_oversight else 'no'}, "
-                f"kill_switch: {'yes' if has_kill_switch else 'no'}, "
-                f"degradation_modes: {'yes' if has_degradation else 'no'}",
+        details=(f"human_oversight: {'yes' if has_oversight else 'no'}, "
+                 f"kill_switch: {'yes' if has_kill_switch else 'no'}, "
+                 f"degradation_modes: {'yes' if has_degradation else 'no'}") if _VERBOSE_DETAILS else "",
     ))
 
     return checks
@@ -627,22 +730,134 @@ def validate_trust(card: dict) -> list[CheckResult]:
 # IMPLEMENTATION VALIDATION
 # =============================================================================
 
+# Magic-number scan patterns (check #10). Bytes-mode so source files can
+# be scanned without decoding. Whitespace is [ \t] rather than \s so a
+# match can never straddle a newline when run over a whole mmap'd file.
+_MAGIC_RE = re.compile(rb'(?:if|>|<|>=|<=|==)[ \t]*\d+\.?\d*(?![ \t]*[,\]\)])')
+_SKIP_RE = re.compile(rb'import|version|range|len\(', re.I)
+# Per-file scan budget: roughly the old 2000-line cap at typical source
+# line lengths, bounding pathological generated files.
+_SCAN_BYTE_CAP = 1 << 18
+
+
+@lru_cache(maxsize=None)
+def _compile_glob(pattern: str) -> re.Pattern:
+    """Translate a recursive glob pattern into a regex over relative paths."""
+    parts = pattern.split("/")
+    out = []
+    for i, part in enumerate(parts):
+        last = i == len(parts) - 1
+        if part == "**":
+            out.append(".*" if last else r"(?:[^/]+/)*")
+            continue
+        piece = "".join(
+            "[^/]*" if ch == "*" else "[^/]" if ch == "?" else re.escape(ch)
+            for ch in part
+        )
+        out.append(piece if last else piece + "/")
+    return re.compile("".join(out) + r"\Z")
+
+
+class _ProjectIndex:
+    """Single-pass index of a project tree.
+
+    validate_implementation used to issue ~20 glob.glob(..., recursive=True)
+    calls, each re-walking the tree and re-stat()ing every entry. One
+    os.scandir() walk (DirEntry metadata is cached, so each entry is
+    stat'd at most once) collects all paths up front; the pattern checks
+    then run in memory against the cached lists.
+
+    Matching is deliberately stricter than the glob calls it replaced:
+    a pattern only matches entries that actually exist. On Python
+    < 3.13, glob.glob("dir/**", recursive=True) reported a phantom
+    "dir/" hit even when dir was missing, so the structure checks built
+    on those patterns (swap tests, event schemas under src/, assumption
+    guards, isolation tests) could pass vacuously. Those checks now
+    score what is really on disk, which can cost projects points the
+    old scan handed out for free.
+    """
+
+    def __init__(self, root: Path):
+        self.root = str(root)
+        # Joined once; per-hit paths are then plain string concatenation
+        # instead of os.path.join calls.
+        self._prefix = self.root.rstrip(os.sep) + os.sep
+        self.files: list[str] = []  # '/'-relative file paths
+        self.dirs: list[str] = []   # '/'-relative directory paths
+        self._walk(self.root, "", {os.path.realpath(self.root)})
+        self.dir_set = frozenset(self.dirs)
+
+    def _walk(self, abs_dir: str, rel_prefix: str, seen: set):
+        try:
+            entries = list(os.scandir(abs_dir))
+        except OSError:
+            return
+        for entry in entries:
+            name = entry.name
+            if name.startswith("."):
+                continue  # glob never matched hidden entries either
+            rel = rel_prefix + name
+            try:
+                # Follow symlinks, as the Path.is_dir checks and the
+                # literal prefixes of the old glob patterns did; `seen`
+                # holds the real paths of the current ancestor chain so
+                # link cycles terminate while distinct aliases of the
+                # same tree still all get indexed.
+                if entry.is_dir():
+                    self.dirs.append(rel)
+                    real = os.path.realpath(entry.path)
+                    if real not in seen:
+                        seen.add(real)
+                        self._walk(entry.path, rel + "/", seen)
+                        seen.discard(real)
+                else:
+                    self.files.append(rel)
+            except OSError:
+                continue
+
+    def glob(self, pattern: str, files_only: bool = False) -> list[str]:
+        """In-memory equivalent of glob.glob(root/pattern, recursive=True)."""
+        regex = _compile_glob(pattern)
+        match = regex.match
+        hits = [rel for rel in self.files if match(rel)]
+        if not files_only:
+            hits += [rel for rel in self.dirs if match(rel)]
+        prefix = self._prefix
+        return [prefix + rel for rel in hits]
+
+
+def _count_matches(idx: "_ProjectIndex", patterns) -> int:
+    """Count index entries matching any of the glob patterns.
+
+    One alternation regex in a single pass tests each path exactly once,
+    so overlapping patterns can't double-count and no set is needed.
+    """
+    rx = re.compile("|".join(
+        f"(?:{_compile_glob(p).pattern})" for p in patterns))
+    match = rx.match
+    return (sum(1 for rel in idx.files if match(rel)) +
+            sum(1 for rel in idx.dirs if match(rel)))
+
+
 def validate_implementation(project_path: str, card: dict) -> list[CheckResult]:
     """Validate project implementation against card claims."""
     checks = []
     p = Path(project_path)
+    idx = _ProjectIndex(p)
 
     # 1. Project structure
     expected_dirs = ["interfaces", "implementations", "config", "events", "core", "tests"]
-    found_dirs = [d for d in expected_dirs if (p / d).is_dir()]
+    # Top-level directories are already enumerated in the index, so no
+    # stat() calls are needed here.
+    dir_status = {d: d in idx.dir_set for d in expected_dirs}
+    found_dirs = [d for d, ok in dir_status.items() if ok]
     # Also check common alternative structures
     alt_dirs = ["src", "lib", "test", "spec"]
-    alt_found = [d for d in alt_dirs if (p / d).is_dir()]
+    alt_found = [d for d in alt_dirs if d in idx.dir_set]
 
     struct_subs = [
-        SubCheck(d, (p / d).is_dir(),
-                 "found" if (p / d).is_dir() else "missing")
-        for d in expected_dirs
+        SubCheck(d, ok, "found" if ok else "missing")
+        for d, ok in dir_status.items()
     ]
     struct_score = len(found_dirs) / len(expected_dirs) * 5
     checks.append(CheckResult(
@@ -662,21 +877,22 @@ def validate_implementation(project_path: str, card: dict) -> list[CheckResult]:
     interface_subs = []
     for ap in swappable_aps:
         ap_name = ap.get("name", "unknown")
-        interface_name = ap.get("interface", "")
-        # Search for interface file
-        patterns = [
-            f"interfaces/*{ap_name}*",
-            f"interfaces/*{interface_name.lower()}*",
-            f"src/interfaces/*{ap_name}*",
-            f"**/interface*{ap_name}*",
-        ]
-        found = False
-        for pattern in patterns:
-            if glob.glob(str(p / pattern), recursive=True):
-                found = True
-                break
+        ap_id = ap.get("id", "???")
+        iface = ap.get("interface", "")
+        iface_lower = iface.lower()
+        # One alternation regex per AP instead of 3-4 separate passes over
+        # the index; any() stops at the first hit.
+        rx = re.compile("|".join(
+            f"(?:{_compile_glob(p).pattern})" for p in (
+                f"interfaces/*{ap_name}*",
+                f"interfaces/*{iface_lower}*",
+                f"src/interfaces/*{ap_name}*",
+                f"**/interface*{ap_name}*",
+            )))
+        match = rx.match
+        found = any(map(match, idx.files)) or any(map(match, idx.dirs))
         interface_subs.append(SubCheck(
-            f"AP {ap.get('id', '???')}: {ap_name} ({interface_name})",
+            f"AP {ap_id}: {ap_name} ({iface})",
             found,
             "interface file found" if found else "no interface file"
         ))
@@ -699,18 +915,17 @@ def validate_implementation(project_path: str, card: dict) -> list[CheckResult]:
     impl_subs = []
     for ap in swappable_aps:
         ap_name = ap.get("name", "unknown")
-        patterns = [
+        ap_id = ap.get("id", "???")
+        iface_lower = ap.get("interface", "").lower()
+        n_found = _count_matches(idx, (
             f"implementations/**/*{ap_name}*",
-            f"implementations/**/*{ap.get('interface', '').lower()}*",
+            f"implementations/**/*{iface_lower}*",
             f"src/**/*{ap_name}*",
-        ]
-        found_files = set()
-        for pattern in patterns:
-            found_files.update(glob.glob(str(p / pattern), recursive=True))
+        ))
         impl_subs.append(SubCheck(
-            f"AP {ap.get('id', '???')}: {ap_name}",
-            len(found_files) >= 2,
-            f"{len(found_files)} implementations found"
+            f"AP {ap_id}: {ap_name}",
+            n_found >= 2,
+            f"{n_found} implementations found"
         ))
 
     if swappable_aps:
@@ -728,103 +943,88 @@ def validate_implementation(project_path: str, card: dict) -> list[CheckResult]:
     ))
 
     # 4. Swap tests exist
-    test_patterns = [
+    n_swap_tests = _count_matches(idx, (
         "tests/swap/**",
         "tests/*swap*",
         "tests/**/test_*swap*",
         "test/*swap*",
-    ]
-    swap_tests = set()
-    for pattern in test_patterns:
-        swap_tests.update(glob.glob(str(p / pattern), recursive=True))
-    has_swap_tests = len(swap_tests) > 0
+    ))
+    has_swap_tests = n_swap_tests > 0
 
     checks.append(CheckResult(
         name="Swap tests exist",
         passed=has_swap_tests,
         points_earned=20 if has_swap_tests else 0,
         points_possible=20,
-        details=f"{len(swap_tests)} swap test files found" if has_swap_tests else "No swap tests found",
+        details=f"{n_swap_tests} swap test files found" if has_swap_tests else "No swap tests found",
         fix_suggestion="Create tests/swap/ directory with swap tests per the Implementation Guide" if not has_swap_tests else "",
     ))
 
     # 5. Config externalized
-    config_patterns = [
+    n_config_files = _count_matches(idx, (
         "config/**/*.yaml",
         "config/**/*.yml",
         "config/**/*.json",
         "config/**/*.py",
         "*.config.*",
-    ]
-    config_files = set()
-    for pattern in config_patterns:
-        config_files.update(glob.glob(str(p / pattern), recursive=True))
-    has_config = len(config_files) > 0
+    ))
+    has_config = n_config_files > 0
 
     checks.append(CheckResult(
         name="Configuration externalized",
         passed=has_config,
         points_earned=10 if has_config else 0,
         points_possible=10,
-        details=f"{len(config_files)} config files found" if has_config else "No external config files",
+        details=f"{n_config_files} config files found" if has_config else "No external config files",
         fix_suggestion="Create config/ directory with externalized configuration per the Implementation Guide" if not has_config else "",
     ))
 
     # 6. Event schemas exist
-    event_patterns = [
+    n_event_files = _count_matches(idx, (
         "events/**/*.py",
         "events/**/*.ts",
         "events/**/*.json",
         "src/events/**",
-    ]
-    event_files = set()
-    for pattern in event_patterns:
-        event_files.update(glob.glob(str(p / pattern), recursive=True))
+    ))
 
     emitted_events = card.get("composition", {}).get("emits", [])
-    has_event_schemas = len(event_files) > 0 or len(emitted_events) == 0
+    has_event_schemas = n_event_files > 0 or len(emitted_events) == 0
 
     checks.append(CheckResult(
         name="Event schemas defined",
         passed=has_event_schemas,
         points_earned=5 if has_event_schemas else 0,
         points_possible=5,
-        details=f"{len(event_files)} event schema files for {len(emitted_events)} emitted events",
+        details=f"{n_event_files} event schema files for {len(emitted_events)} emitted events",
         fix_suggestion="Create events/ directory with typed schemas for each emitted event" if not has_event_schemas else "",
     ))
 
     # 7. Assumption guard tests
-    test_patterns_assumption = [
+    n_assumption_tests = _count_matches(idx, (
         "tests/assumptions/**",
         "tests/*assumption*",
         "tests/**/test_*da*",
         "tests/*guard*",
-    ]
-    assumption_tests = set()
-    for pattern in test_patterns_assumption:
-        assumption_tests.update(glob.glob(str(p / pattern), recursive=True))
-    has_assumption_tests = len(assumption_tests) > 0
+    ))
+    has_assumption_tests = n_assumption_tests > 0
 
     checks.append(CheckResult(
         name="Assumption guard tests",
         passed=has_assumption_tests,
         points_earned=10 if has_assumption_tests else 0,
         points_possible=10,
-        details=f"{len(assumption_tests)} assumption test files found" if has_assumption_tests else "No assumption tests",
+        details=f"{n_assumption_tests} assumption test files found" if has_assumption_tests else "No assumption tests",
         fix_suggestion="Create tests/assumptions/ with tests for hard assumption guards" if not has_assumption_tests else "",
     ))
 
     # 8. Isolation tests
-    isolation_patterns = [
+    n_isolation_tests = _count_matches(idx, (
         "tests/isolation/**",
         "tests/*isolation*",
         "tests/*standalone*",
         "tests/**/test_*standalone*",
-    ]
-    isolation_tests = set()
-    for pattern in isolation_patterns:
-        isolation_tests.update(glob.glob(str(p / pattern), recursive=True))
-    has_isolation = len(isolation_tests) > 0
+    ))
+    has_isolation = n_isolation_tests > 0
 
     # Check if there are optional delegates
     delegates = card.get("composition", {}).get("delegates_to", [])
@@ -836,12 +1036,12 @@ def validate_implementation(project_path: str, card: dict) -> list[CheckResult]:
         passed=has_isolation or not needs_isolation,
         points_earned=5 if (has_isolation or not needs_isolation) else 0,
         points_possible=5,
-        details=f"{len(isolation_tests)} isolation tests for {len(optional_delegates)} optional delegates",
+        details=f"{n_isolation_tests} isolation tests for {len(optional_delegates)} optional delegates",
         fix_suggestion="Create tests/isolation/ to verify behavior works without optional delegates" if (not has_isolation and needs_isolation) else "",
     ))
 
     # 9. ABC card file present in project
-    card_files = glob.glob(str(p / "abc-card.*")) + glob.glob(str(p / "abc_card.*"))
+    card_files = idx.glob("abc-card.*") + idx.glob("abc_card.*")
     has_card_in_project = len(card_files) > 0
 
     checks.append(CheckResult(
@@ -854,31 +1054,67 @@ def validate_implementation(project_path: str, card: dict) -> list[CheckResult]:
     ))
 
     # 10. No hardcoded magic numbers (basic static analysis)
-    # Scan core/ and src/ for common anti-patterns
-    source_files = (
-        glob.glob(str(p / "core/**/*.py"), recursive=True) +
-        glob.glob(str(p / "src/**/*.py"), recursive=True) +
-        glob.glob(str(p / "core/**/*.ts"), recursive=True) +
-        glob.glob(str(p / "src/**/*.ts"), recursive=True)
-    )
+    # Scan core/ and src/ for common anti-patterns. One pass over the
+    # index with prefix/suffix string tests replaces four glob passes;
+    # buckets keep the original core-py/src-py/core-ts/src-ts scan order.
+    buckets = ([], [], [], [])
+    prefix = idx._prefix
+    for rel in idx.files:
+        if rel.endswith(".py"):
+            offset = 0
+        elif rel.endswith(".ts"):
+            offset = 2
+        else:
+            continue
+        if rel.startswith("core/"):
+            buckets[offset].append(prefix + rel)
+        elif rel.startswith("src/"):
+            buckets[offset + 1].append(prefix + rel)
+    source_files = buckets[0] + buckets[1] + buckets[2] + buckets[3]
 
     magic_number_count = 0
     hardcoded_examples = []
-    magic_pattern = re.compile(r'(?:if|>|<|>=|<=|==)\s*\d+\.?\d*(?!\s*[,\]\)])')
 
     for sf in source_files[:20]:  # Limit scan
+        # Score clamps to 0 at count 10; past 15 more hits can't change the
+        # score or the examples, so stop reading files.
+        if magic_number_count >= 15:
+            break
         try:
-            with open(sf) as f:
-                for i, line in enumerate(f, 1):
-                    stripped = line.strip()
-                    if stripped.startswith('#') or stripped.startswith('//'):
-                        continue
-                    matches = magic_pattern.findall(stripped)
-                    if matches and not any(skip in stripped.lower()
-                                           for skip in ['import', 'version', 'range', 'len(']):
-                        magic_number_count += len(matches)
-                        if len(hardcoded_examples) < 3:
-                            hardcoded_examples.append(f"  {os.path.basename(sf)}:{i}: {stripped[:80]}")
+            with open(sf, 'rb') as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:  # empty file
+                    continue
+                with mm:
+                    end = min(len(mm), _SCAN_BYTE_CAP)
+                    # The regex runs over the raw mapping; line context is
+                    # recovered per match and cached so several hits on
+                    # the same line qualify it only once.
+                    line_end = -1
+                    line_ok = False
+                    stripped = b""
+                    for m in _MAGIC_RE.finditer(mm, 0, end):
+                        start = m.start()
+                        if start >= line_end:
+                            line_start = mm.rfind(b'\n', 0, start) + 1
+                            nl = mm.find(b'\n', start, end)
+                            line_end = end if nl < 0 else nl
+                            stripped = mm[line_start:line_end].strip()
+                            line_ok = not (
+                                stripped.startswith(b'#')
+                                or stripped.startswith(b'//')
+                                or _SKIP_RE.search(stripped))
+                        if line_ok:
+                            magic_number_count += 1
+                            if len(hardcoded_examples) < 3:
+                                # Line numbers only exist for the <=3
+                                # reported examples, so the newline count
+                                # is paid at most three times.
+                                lineno = mm[:start].count(b'\n') + 1
+                                text = stripped.decode(errors='replace')[:80]
+                                hardcoded_examples.append(
+                                    f"  {os.path.basename(sf)}:{lineno}: {text}")
         except Exception:
             pass
 
@@ -901,11 +1137,14 @@ def validate_implementation(project_path: str, card: dict) -> list[CheckResult]:
 # =============================================================================
 
 def calculate_score(checks: list[CheckResult]) -> float:
-    total_earned = sum(c.points_earned for c in checks)
-    total_possible = sum(c.points_possible for c in checks)
-    if total_possible == 0:
+    # Single pass accumulating both sums instead of two generator passes.
+    earned = possible = 0.0
+    for c in checks:
+        earned += c.points_earned
+        possible += c.points_possible
+    if possible == 0:
         return 0
-    return round(total_earned / total_possible * 100, 1)
+    return round(earned / possible * 100, 1)
 
 
 def determine_level(score: float) -> str:
@@ -937,101 +1176,108 @@ def print_report(report: ComplianceReport, show_details: bool = True,
     c = Colors
     w = 56
 
+    # Hoist the per-row invariants: color codes into locals, the shared
+    # "│" prefix and horizontal rules into prebuilt strings, and the
+    # repeated row shapes into templates baked once per report (the color
+    # state isn't known until Colors.disable() may have run, so "bake at
+    # import time" becomes "bake at function entry").
+    cyan, reset, bold, dim = c.CYAN, c.RESET, c.BOLD, c.DIM
+    green, red, yellow = c.GREEN, c.RED, c.YELLOW
+    pipe = f"{cyan}│{reset}"
+    rule = f"{cyan}├{'─' * w}┤{reset}"
+    sub_w = w - 8       # width of a sub-check row's text column
+    fix_w = w - 8       # width of a fix row's text column
+    check_tmpl = pipe + "  {} {}{} │"
+    fix_tmpl = pipe + "     " + yellow + "→ {}" + reset + "{}│"
+
+    def check_row(check):
+        status = _ICON_OK if check.passed else _ICON_FAIL
+        name = check.name[:35]
+        score = f"{check.points_earned:.0f}/{check.points_possible:.0f}"
+        # name is capped at 35 chars, so ljust always pads here
+        print(check_tmpl.format(status, name.ljust(w - 5 - len(score)), score))
+
+    def fix_row(check):
+        fix = check.fix_suggestion[:w - 10]
+        print(fix_tmpl.format(fix, ' ' * (fix_w - len(fix))))
+
     print()
-    print(f"{c.CYAN}┌{'─' * w}┐{c.RESET}")
-    print(f"{c.CYAN}│{c.BOLD}{c.WHITE} ABC Compliance Report{' ' * (w - 22)}│{c.RESET}")
-    print(f"{c.CYAN}│{c.RESET} Card: {c.BOLD}{report.card_name}{c.RESET}"
+    print(f"{cyan}┌{'─' * w}┐{reset}")
+    print(f"{cyan}│{bold}{c.WHITE} ABC Compliance Report{' ' * (w - 22)}│{reset}")
+    print(f"{pipe} Card: {bold}{report.card_name}{reset}"
           f"{' ' * max(1, w - 7 - len(report.card_name))}│")
-    print(f"{c.CYAN}│{c.RESET} Version: {report.card_version}  |  "
+    print(f"{pipe} Version: {report.card_version}  |  "
           f"Spec: {report.spec_version}"
           f"{' ' * max(1, w - 24 - len(report.card_version) - len(report.spec_version))}│")
     if report.project_path:
         path_display = report.project_path[:w - 9]
-        print(f"{c.CYAN}│{c.RESET} Path: {path_display}"
+        print(f"{pipe} Path: {path_display}"
               f"{' ' * max(1, w - 7 - len(path_display))}│")
-    print(f"{c.CYAN}├{'─' * w}┤{c.RESET}")
+    print(rule)
 
     # Card validation
     if report.card_checks:
-        print(f"{c.CYAN}│{c.BOLD} Card Validation{' ' * (w - 16)}│{c.RESET}")
+        print(f"{cyan}│{bold} Card Validation{' ' * (w - 16)}│{reset}")
         for check in report.card_checks:
-            status = icon(check.passed)
-            name = check.name[:35]
-            score = f"{check.points_earned:.0f}/{check.points_possible:.0f}"
-            padding = w - 5 - len(name) - len(score)
-            print(f"{c.CYAN}│{c.RESET}  {status} {name}{' ' * max(1, padding)}{score} │")
+            check_row(check)
 
             if show_details and check.sub_checks:
                 for sub in check.sub_checks:
-                    sub_icon = f"{c.GREEN}·{c.RESET}" if sub.passed else f"{c.RED}·{c.RESET}"
-                    sub_text = f"{sub.item[:40]}"
-                    print(f"{c.CYAN}│{c.RESET}     {sub_icon} {c.DIM}{sub_text}{c.RESET}"
-                          f"{' ' * max(1, w - 8 - len(sub_text))}│")
+                    sub_icon = f"{green}·{reset}" if sub.passed else f"{red}·{reset}"
+                    sub_text = sub.item[:40]
+                    print(f"{pipe}     {sub_icon} {dim}{sub_text}{reset}"
+                          f"{' ' * (sub_w - len(sub_text))}│")
 
             if show_fixes and check.fix_suggestion:
-                fix = check.fix_suggestion[:w - 10]
-                print(f"{c.CYAN}│{c.RESET}     {c.YELLOW}→ {fix}{c.RESET}"
-                      f"{' ' * max(1, w - 8 - len(fix))}│")
+                fix_row(check)
 
         cv_score = f"{report.card_validation_score:.0f}/100"
-        print(f"{c.CYAN}│{c.RESET}  {'Card Score:':>38} {c.BOLD}{cv_score}{c.RESET}"
+        print(f"{pipe}  {'Card Score:':>38} {bold}{cv_score}{reset}"
               f"{' ' * max(1, w - 46 - len(cv_score))}│")
-        print(f"{c.CYAN}├{'─' * w}┤{c.RESET}")
+        print(rule)
 
     # Trust validation
     if report.trust_checks:
-        print(f"{c.CYAN}│{c.BOLD} Trust & Safety{' ' * (w - 15)}│{c.RESET}")
+        print(f"{cyan}│{bold} Trust & Safety{' ' * (w - 15)}│{reset}")
         for check in report.trust_checks:
-            status = icon(check.passed)
-            name = check.name[:35]
-            score = f"{check.points_earned:.0f}/{check.points_possible:.0f}"
-            padding = w - 5 - len(name) - len(score)
-            print(f"{c.CYAN}│{c.RESET}  {status} {name}{' ' * max(1, padding)}{score} │")
+            check_row(check)
 
             if show_fixes and check.fix_suggestion:
-                fix = check.fix_suggestion[:w - 10]
-                print(f"{c.CYAN}│{c.RESET}     {c.YELLOW}→ {fix}{c.RESET}"
-                      f"{' ' * max(1, w - 8 - len(fix))}│")
+                fix_row(check)
 
         ts_score = f"{report.trust_score:.0f}/100"
-        print(f"{c.CYAN}│{c.RESET}  {'Trust Score:':>38} {c.BOLD}{ts_score}{c.RESET}"
+        print(f"{pipe}  {'Trust Score:':>38} {bold}{ts_score}{reset}"
               f"{' ' * max(1, w - 47 - len(ts_score))}│")
-        print(f"{c.CYAN}├{'─' * w}┤{c.RESET}")
+        print(rule)
 
     # Implementation validation
     if report.implementation_checks:
-        print(f"{c.CYAN}│{c.BOLD} Implementation Compliance{' ' * (w - 26)}│{c.RESET}")
+        print(f"{cyan}│{bold} Implementation Compliance{' ' * (w - 26)}│{reset}")
         for check in report.implementation_checks:
-            status = icon(check.passed)
-            name = check.name[:35]
-            score = f"{check.points_earned:.0f}/{check.points_possible:.0f}"
-            padding = w - 5 - len(name) - len(score)
-            print(f"{c.CYAN}│{c.RESET}  {status} {name}{' ' * max(1, padding)}{score} │")
+            check_row(check)
 
             if show_fixes and check.fix_suggestion:
-                fix = check.fix_suggestion[:w - 10]
-                print(f"{c.CYAN}│{c.RESET}     {c.YELLOW}→ {fix}{c.RESET}"
-                      f"{' ' * max(1, w - 8 - len(fix))}│")
+                fix_row(check)
 
         is_score = f"{report.implementation_score:.0f}/100"
-        print(f"{c.CYAN}│{c.RESET}  {'Implementation Score:':>38} {c.BOLD}{is_score}{c.RESET}"
+        print(f"{pipe}  {'Implementation Score:':>38} {bold}{is_score}{reset}"
               f"{' ' * max(1, w - 47 - len(is_score))}│")
-        print(f"{c.CYAN}├{'─' * w}┤{c.RESET}")
+        print(rule)
 
     # Overall
     lc = level_color(report.level)
     overall = f"{report.overall_score:.0f}/100"
-    print(f"{c.CYAN}│{c.RESET}")
-    print(f"{c.CYAN}│{c.RESET}  {c.BOLD}Overall Score: {overall}  —  "
-          f"{lc}{report.level}{c.RESET}")
-    print(f"{c.CYAN}│{c.RESET}")
+    print(pipe)
+    print(f"{pipe}  {bold}Overall Score: {overall}  —  "
+          f"{lc}{report.level}{reset}")
+    print(pipe)
 
     if report.suggestions:
-        print(f"{c.CYAN}│{c.RESET}  {c.YELLOW}Top actions:{c.RESET}")
+        print(f"{pipe}  {yellow}Top actions:{reset}")
         for s in report.suggestions[:3]:
-            print(f"{c.CYAN}│{c.RESET}    → {s[:w - 7]}")
+            print(f"{pipe}    → {s[:w - 7]}")
 
-    print(f"{c.CYAN}└{'─' * w}┘{c.RESET}")
+    print(f"{cyan}└{'─' * w}┘{reset}")
     print()
 
 
@@ -1039,6 +1285,43 @@ def print_report(report: ComplianceReport, show_details: bool = True,
 # MAIN
 # =============================================================================
 
+_CACHE_DIR = Path.home() / ".cache" / "abc-check"
+
+
+def _load_card_cached(path: str) -> dict:
+    """Load a card YAML, caching the parsed result on disk as JSON.
+
+    The cache key includes mtime and size, so editing a card invalidates
+    its entry automatically; unchanged cards skip the YAML parse entirely
+    on repeat runs (CI invokes the checker per-project, per-commit).
+    """
+    cache_file = None
+    try:
+        st = os.stat(path)
+        key = f"{os.path.abspath(path)}:{st.st_mtime_ns}:{st.st_size}"
+        cache_file = _CACHE_DIR / (hashlib.sha1(key.encode()).hexdigest() + ".json")
+        if cache_file.exists():
+            with open(cache_file) as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    with open(path) as f:
+        card = _yaml_load(f)
+
+    if cache_file is not None:
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "w") as f:
+                # default=str flattens YAML dates; validation only ever
+                # checks presence/format of those fields, never the type.
+                json.dump(card, f, default=str)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    return card
+
+
 def find_card(path: str) -> Optional[str]:
     """Find the ABC card file in a project directory."""
     p = Path(path)
@@ -1053,21 +1336,25 @@ def find_card(path: str) -> Optional[str]:
         if c.exists():
             return str(c)
 
-    # Search all yaml files in root
-    for f in p.glob("*.yaml"):
-        try:
-            with open(f) as fh:
-                content = yaml.safe_load(fh)
-                if isinstance(content, dict) and "abc_version" in content:
-                    return str(f)
-        except Exception:
-            pass
-    for f in p.glob("*.yml"):
+    # Search all yaml files in root. A cheap head-read prefilter decides
+    # whether a file is worth YAML-parsing at all — project roots are full
+    # of unrelated yaml (CI configs, docker-compose) that would otherwise
+    # pay a full safe_load just to be rejected.
+    try:
+        entries = sorted(os.scandir(path), key=lambda e: e.name)
+    except OSError:
+        return None
+    for entry in entries:
+        if not entry.name.endswith((".yaml", ".yml")) or not entry.is_file():
+            continue
         try:
-            with open(f) as fh:
-                content = yaml.safe_load(fh)
-                if isinstance(content, dict) and "abc_version" in content:
-                    return str(f)
+            with open(entry.path, "rb") as fh:
+                if b"abc_version" not in fh.read(4096):
+                    continue
+            with open(entry.path) as fh:
+                content = _yaml_load(fh)
+            if isinstance(content, dict) and "abc_version" in content:
+                return entry.path
         except Exception:
             pass
 
@@ -1075,8 +1362,11 @@ def find_card(path: str) -> Optional[str]:
 
 
 def run_check(path: str, card_only: bool = False, json_output: bool = False,
-              show_fixes: bool = False, no_color: bool = False) -> ComplianceReport:
+              show_fixes: bool = False, no_color: bool = False,
+              verbose: bool = False, quiet: bool = False) -> ComplianceReport:
     """Run the full compliance check."""
+    global _VERBOSE_DETAILS
+    _VERBOSE_DETAILS = verbose or not json_output
 
     if no_color:
         Colors.disable()
@@ -1092,24 +1382,22 @@ def run_check(path: str, card_only: bool = False, json_output: bool = False,
         card_path = find_card(str(p))
         project_path = str(p)
         if not card_path:
-            print(f"{Colors.RED}ERROR: No ABC card found in {path}{Colors.RESET}")
-            print(f"  Looked for: abc-card.yaml, abc_card.yaml, or any .yaml with abc_version")
-            sys.exit(4)
+            raise ComplianceError(
+                4, f"No ABC card found in {path}",
+                hint="Looked for: abc-card.yaml, abc_card.yaml, or any .yaml with abc_version")
     else:
-        print(f"{Colors.RED}ERROR: Path not found: {path}{Colors.RESET}")
-        sys.exit(4)
+        raise ComplianceError(4, f"Path not found: {path}")
 
     # Load card
     try:
-        with open(card_path) as f:
-            card = yaml.safe_load(f)
+        card = _load_card_cached(card_path)
+    except ComplianceError:
+        raise
     except Exception as e:
-        print(f"{Colors.RED}ERROR: Failed to parse {card_path}: {e}{Colors.RESET}")
-        sys.exit(4)
+        raise ComplianceError(4, f"Failed to parse {card_path}: {e}")
 
     if not isinstance(card, dict):
-        print(f"{Colors.RED}ERROR: Card is not a valid YAML mapping{Colors.RESET}")
-        sys.exit(4)
+        raise ComplianceError(4, "Card is not a valid YAML mapping")
 
     report.card_name = card.get("identity", {}).get("display_name",
                        card.get("identity", {}).get("name", "Unknown"))
@@ -1144,21 +1432,41 @@ def run_check(path: str, card_only: bool = False, json_output: bool = False,
 
     report.level = determine_level(report.overall_score)
 
-    # Generate suggestions
+    # Generate suggestions — only the top 5 by points deficit are shown,
+    # so a bounded heap beats sorting every failed check.
     all_checks = report.card_checks + report.trust_checks + report.implementation_checks
-    failed = [c for c in all_checks if not c.passed]
-    failed.sort(key=lambda c: c.points_possible - c.points_earned, reverse=True)
-    report.suggestions = [c.fix_suggestion for c in failed if c.fix_suggestion][:5]
-
-    # Output
-    if json_output:
-        print(json.dumps(report.to_dict(), indent=2))
-    else:
-        print_report(report, show_details=True, show_fixes=show_fixes)
+    top_failed = heapq.nlargest(
+        5,
+        (c for c in all_checks if not c.passed and c.fix_suggestion),
+        key=lambda c: c.points_possible - c.points_earned)
+    report.suggestions = [c.fix_suggestion for c in top_failed]
+
+    # Output (suppressed for batch workers — the parent prints the summary)
+    if not quiet:
+        if json_output:
+            # dump() streams to stdout instead of building the whole
+            # document as one string first.
+            json.dump(report.to_dict(), sys.stdout, indent=2)
+            sys.stdout.write("\n")
+        else:
+            print_report(report, show_details=True, show_fixes=show_fixes)
 
     return report
 
 
+def _batch_one(task):
+    """Run one card check quietly in a --batch worker process."""
+    card_path, json_output, show_fixes, no_color, verbose = task
+    name = os.path.basename(card_path)
+    try:
+        report = run_check(card_path, card_only=True, json_output=json_output,
+                           show_fixes=show_fixes, no_color=no_color,
+                           verbose=verbose, quiet=True)
+        return (name, report, None)
+    except (Exception, SystemExit) as e:
+        return (name, None, str(e))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="ABC Compliance Checker — Validate Agent Behavior Cards",
@@ -1177,6 +1485,8 @@ Examples:
                         help="Card-only validation (skip implementation checks)")
     parser.add_argument("--json", action="store_true",
                         help="Output as JSON")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Include per-field detail strings in JSON output")
     parser.add_argument("--fix", action="store_true",
                         help="Show fix suggestions for failed checks")
     parser.add_argument("--no-color", action="store_true",
@@ -1193,20 +1503,34 @@ Examples:
             print(f"ERROR: {args.path} is not a directory")
             sys.exit(4)
 
+        if args.no_color:
+            Colors.disable()
+
         cards = list(p.glob("*.yaml")) + list(p.glob("*.yml"))
-        results = []
+        card_files = []
         for card_file in sorted(cards):
             try:
                 with open(card_file) as f:
-                    content = yaml.safe_load(f)
+                    content = _yaml_load(f)
                 if isinstance(content, dict) and "abc_version" in content:
-                    report = run_check(str(card_file), card_only=True,
-                                       json_output=False, show_fixes=args.fix,
-                                       no_color=args.no_color)
-                    results.append((card_file.name, report))
+                    card_files.append(str(card_file))
             except Exception as e:
                 print(f"{Colors.YELLOW}Skipping {card_file.name}: {e}{Colors.RESET}")
 
+        # Each check is a pure function of its card file, so batch mode
+        # fans out across cores and only the parent prints results.
+        results = []
+        if card_files:
+            tasks = [(cf, args.json, args.fix, args.no_color, args.verbose)
+                     for cf in card_files]
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=os.cpu_count()) as pool:
+                for name, report, error in pool.map(_batch_one, tasks):
+                    if error is not None:
+                        print(f"{Colors.YELLOW}Skipping {name}: {error}{Colors.RESET}")
+                    else:
+                        results.append((name, report))
+
         if not args.json:
             # Print summary table
             print(f"\n{Colors.BOLD}{'=' * 70}")
@@ -1221,14 +1545,18 @@ Examples:
             print()
 
         if args.json:
-            batch_output = {
-                "total_cards": len(results),
-                "results": [
-                    {"file": name, **report.to_dict()}
-                    for name, report in results
-                ]
-            }
-            print(json.dumps(batch_output, indent=2))
+            # Stream one card at a time rather than materializing every
+            # to_dict() plus the full rendered document at once.
+            out = sys.stdout
+            out.write(f'{{\n  "total_cards": {len(results)},\n  "results": [')
+            for i, (name, report) in enumerate(results):
+                if i:
+                    out.write(",")
+                rendered = json.dumps({"file": name, **report.to_dict()},
+                                      indent=2)
+                out.write("\n" + "\n".join(
+                    "    " + ln for ln in rendered.splitlines()))
+            out.write("\n  ]\n}\n" if results else "]\n}\n")
 
         # Exit code based on worst result
         if results:
@@ -1240,9 +1568,15 @@ Examples:
         sys.exit(0)
 
     else:
-        report = run_check(args.path, card_only=args.card,
-                           json_output=args.json, show_fixes=args.fix,
-                           no_color=args.no_color)
+        try:
+            report = run_check(args.path, card_only=args.card,
+                               json_output=args.json, show_fixes=args.fix,
+                               no_color=args.no_color, verbose=args.verbose)
+        except ComplianceError as e:
+            print(f"{Colors.RED}ERROR: {e}{Colors.RESET}")
+            if e.hint:
+                print(f"  {e.hint}")
+            sys.exit(e.code)
 
         # Exit code
         if report.overall_score >= 90: sys.exit(0)
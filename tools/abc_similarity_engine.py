@@ -12,14 +12,29 @@ Usage:
     engine = ABCSimilarityEngine(anthropic_api_key="...")
     score = engine.compare(card_a, card_b)
     matches = engine.find_similar(card_a, registry)
+
+Implementation note: the set-based dimensions intern tokens into a
+shared vocabulary at prepare() time and run as int-bitset and/or plus
+popcount. That already is the "integer token IDs" kernel a Numba port
+would target, minus the dependency — the remaining per-pair work is a
+few bitwise ops on native ints, where @njit dispatch overhead would
+outweigh the loop body. Keep this module stdlib-only.
 """
 
+import asyncio
+import hashlib
 import json
 import re
-import asyncio
+import zlib
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # =============================================================================
 # SIMILARITY DIMENSIONS
@@ -27,11 +42,15 @@ from typing import Optional
 # Instead of one opaque number, we decompose similarity into measurable axes.
 # Each dimension answers a specific question about portability.
 
-@dataclass
+@dataclass(frozen=True)
 class SimilarityBreakdown:
     """
     Multi-dimensional similarity score between two behavior cards.
     Each dimension is 0.0 to 1.0. The composite is a weighted combination.
+
+    Frozen so the derived values (composite_score, explanation) can be
+    computed once and cached — breakdowns get printed and serialized
+    repeatedly when a registry is scored.
     """
 
     # 1. Do they solve the same abstract problem?
@@ -59,8 +78,16 @@ class SimilarityBreakdown:
     #    Computed by: Overlap in emitted/consumed events and delegate interfaces
     composition_compatibility: float = 0.0
 
+    # True when the LLM dimensions were skipped because the cheap
+    # dimensions already bounded the composite below a caller-supplied
+    # threshold. Dimensions 1 and 4 are 0.0 in that case, not measured.
+    llm_skipped: bool = False
+
     # The weights for the composite score
-    # These are tunable — different registries might weight differently
+    # These are tunable — different registries might weight differently.
+    # composite_score and the LLM-skip bound in compare_prepared_async
+    # read the per-dimension constants unpacked below, so tuning this
+    # dict keeps every consumer in sync.
     WEIGHTS = {
         "problem_pattern_similarity": 0.30,  # Most important: same problem?
         "sub_pattern_overlap": 0.15,
@@ -70,15 +97,31 @@ class SimilarityBreakdown:
         "composition_compatibility": 0.10,
     }
 
-    @property
+    # Unpacked once at class definition so the hot paths read plain
+    # attributes instead of dict slots
+    _W_PROBLEM = WEIGHTS["problem_pattern_similarity"]
+    _W_SUB = WEIGHTS["sub_pattern_overlap"]
+    _W_IO = WEIGHTS["io_structural_similarity"]
+    _W_REASONING = WEIGHTS["reasoning_similarity"]
+    _W_ADAPT = WEIGHTS["adaptation_portability"]
+    _W_COMPOSE = WEIGHTS["composition_compatibility"]
+
+    @cached_property
     def composite_score(self) -> float:
         """Weighted composite similarity score (0.0 to 1.0)."""
-        total = 0.0
-        for dim, weight in self.WEIGHTS.items():
-            total += getattr(self, dim) * weight
-        return round(total, 3)
+        # Unrolled form of sum(getattr(self, dim) * w for dim, w in
+        # WEIGHTS.items()), over the constants derived from WEIGHTS.
+        return round(
+            self.problem_pattern_similarity * self._W_PROBLEM +
+            self.sub_pattern_overlap * self._W_SUB +
+            self.io_structural_similarity * self._W_IO +
+            self.reasoning_similarity * self._W_REASONING +
+            self.adaptation_portability * self._W_ADAPT +
+            self.composition_compatibility * self._W_COMPOSE,
+            3
+        )
 
-    @property
+    @cached_property
     def explanation(self) -> str:
         """Human-readable explanation of the similarity score."""
         lines = [
@@ -109,15 +152,17 @@ class SimilarityBreakdown:
             return "low overlap"
 
     def to_dict(self) -> dict:
+        # The dimension kernels return full precision; round only here,
+        # at the serialization boundary.
         return {
             "composite_score": self.composite_score,
             "dimensions": {
-                "problem_pattern_similarity": self.problem_pattern_similarity,
-                "sub_pattern_overlap": self.sub_pattern_overlap,
-                "io_structural_similarity": self.io_structural_similarity,
-                "reasoning_similarity": self.reasoning_similarity,
-                "adaptation_portability": self.adaptation_portability,
-                "composition_compatibility": self.composition_compatibility,
+                "problem_pattern_similarity": round(self.problem_pattern_similarity, 3),
+                "sub_pattern_overlap": round(self.sub_pattern_overlap, 3),
+                "io_structural_similarity": round(self.io_structural_similarity, 3),
+                "reasoning_similarity": round(self.reasoning_similarity, 3),
+                "adaptation_portability": round(self.adaptation_portability, 3),
+                "composition_compatibility": round(self.composition_compatibility, 3),
             },
             "weights": self.WEIGHTS,
         }
@@ -205,19 +250,277 @@ def parse_card(card_data: dict) -> ParsedCard:
     return parsed
 
 
+@dataclass(frozen=True)
+class PreparedCard:
+    """A ParsedCard plus the derived sets the set-based dimensions read.
+
+    Tokenizing every list field happens once here instead of inside each
+    pairwise comparison, which matters when a card is compared against a
+    whole registry. Each set is stored as an int bitset over a shared
+    process-wide vocabulary, so the pairwise set algebra runs as bitwise
+    ops plus popcount instead of hash-set operations.
+    """
+    parsed: ParsedCard
+    sub_patterns: int
+    sub_pattern_tokens: int
+    input_name_tokens: int
+    input_type_tokens: int
+    output_name_tokens: int
+    output_type_tokens: int
+    event_tokens: int
+    emitted_events: int
+    consumed_events: int
+    interface_tokens: int
+    # MinHash signature over the union of all token dimensions, used to
+    # cheaply reject low-similarity candidates in registry scans
+    minhash: tuple
+    # Scalars for the adaptation-portability dimension, folded down from
+    # the assumption/adaptation-point dicts so pairwise scoring is pure
+    # arithmetic
+    softness: float       # fraction of soft assumptions
+    swappability: float   # fraction of swappable adaptation points
+    ap_count: int         # number of adaptation points
+    # Popcount of consumed_events, clamped to 1 — the divisor for the
+    # reverse-direction composability ratio, taken once per card instead
+    # of once per pair
+    consumed_len: int = 1
+
+
+_TOKEN_RE = re.compile(r'[a-z]+')
+
+
+@lru_cache(maxsize=8192)
+def _tokenize_one(s: str) -> frozenset:
+    """Tokens of a single string, memoized.
+
+    The same event names, interface names and I/O fields recur across
+    every pairwise comparison in a registry scan, so each distinct
+    string is tokenized once.
+    """
+    return frozenset(_TOKEN_RE.findall(s.lower()))
+
+
+def _tokenize(strings) -> frozenset:
+    """Lowercase word tokens across a list of strings."""
+    tokens = set()
+    for s in strings:
+        tokens |= _tokenize_one(s)
+    return frozenset(tokens)
+
+
+# Shared vocabulary mapping each distinct token/value to a bit index.
+# Bitsets are only ever compared against bitsets from the same vocabulary,
+# and the dict stays small (one entry per distinct token seen).
+_vocab_bits: dict = {}
+
+
+def _encode(values) -> int:
+    """Encode a collection of hashable values as an int bitset."""
+    bits = _vocab_bits
+    mask = 0
+    for v in values:
+        idx = bits.get(v)
+        if idx is None:
+            idx = bits[v] = len(bits)
+        mask |= 1 << idx
+    return mask
+
+
+def _bitset_jaccard(a: int, b: int) -> float:
+    """Jaccard index of two int bitsets via popcount."""
+    union = a | b
+    if not union:
+        return 1.0  # Both empty = identical
+    return (a & b).bit_count() / union.bit_count()
+
+
+def jaccard_matrix(bitsets: list) -> list:
+    """All-pairs Jaccard matrix for one dimension's bitsets.
+
+    Batch form for registry-wide sweeps: per-row popcounts are taken
+    once, the union size comes from |A|+|B|-|A∩B|, and symmetry halves
+    the work — each pair costs a single AND plus one popcount.
+    """
+    n = len(bitsets)
+    sizes = [b.bit_count() for b in bitsets]
+    matrix = [[1.0] * n for _ in range(n)]
+    for i in range(n):
+        bits_i, size_i, row_i = bitsets[i], sizes[i], matrix[i]
+        for j in range(i + 1, n):
+            inter = (bits_i & bitsets[j]).bit_count()
+            union = size_i + sizes[j] - inter
+            row_i[j] = matrix[j][i] = inter / union if union else 1.0
+    return matrix
+
+
+_MINHASH_WIDTH = 64
+
+
+def _minhash_signature(tokens) -> tuple:
+    """Hand-rolled MinHash over a token set.
+
+    One crc32 per (seed, token) — deterministic across processes, unlike
+    the builtin salted hash(). Matching signature positions estimate the
+    Jaccard index of the underlying sets.
+    """
+    if not tokens:
+        return (0,) * _MINHASH_WIDTH
+    crc = zlib.crc32
+    encoded = [t.encode() for t in tokens]
+    return tuple(min(crc(t, seed) for t in encoded)
+                 for seed in range(_MINHASH_WIDTH))
+
+
+def prepare(card_data: dict) -> PreparedCard:
+    """Parse a card and precompute its token bitsets for comparison."""
+    parsed = parse_card(card_data)
+    sub_pattern_tokens = _tokenize(parsed.sub_patterns)
+    input_name_tokens = _tokenize(parsed.input_names)
+    input_type_tokens = _tokenize(parsed.input_types)
+    output_name_tokens = _tokenize(parsed.output_names)
+    output_type_tokens = _tokenize(parsed.output_types)
+    event_tokens = _tokenize(parsed.emitted_events + parsed.consumed_events)
+    interface_tokens = _tokenize(parsed.delegate_interfaces)
+    strengths = parsed.assumption_strengths
+    soft = sum(1 for s in strengths.values() if s == "soft")
+    ap_types = parsed.adaptation_point_types
+    swappable = sum(1 for t in ap_types.values() if t == "swappable_component")
+    consumed_events = _encode(parsed.consumed_events)
+    return PreparedCard(
+        parsed=parsed,
+        sub_patterns=_encode(parsed.sub_patterns),
+        sub_pattern_tokens=_encode(sub_pattern_tokens),
+        input_name_tokens=_encode(input_name_tokens),
+        input_type_tokens=_encode(input_type_tokens),
+        output_name_tokens=_encode(output_name_tokens),
+        output_type_tokens=_encode(output_type_tokens),
+        event_tokens=_encode(event_tokens),
+        emitted_events=_encode(parsed.emitted_events),
+        consumed_events=consumed_events,
+        interface_tokens=_encode(interface_tokens),
+        minhash=_minhash_signature(
+            sub_pattern_tokens | input_name_tokens | input_type_tokens
+            | output_name_tokens | output_type_tokens | event_tokens
+            | interface_tokens),
+        softness=soft / max(len(strengths), 1),
+        swappability=swappable / max(len(ap_types), 1),
+        ap_count=len(parsed.adaptation_point_ids),
+        consumed_len=max(consumed_events.bit_count(), 1),
+    )
+
+
+@dataclass(frozen=True)
+class RegistryIndex:
+    """Column-oriented (struct-of-arrays) view of a prepared registry.
+
+    Batch sweeps read one column per dimension instead of hopping
+    between PreparedCard objects, and the scalar stats that adaptation
+    portability needs are precomputed per card. Every column lines up
+    with the row order of `prepared`.
+    """
+    prepared: tuple
+    names: tuple
+    sub_patterns: tuple
+    sub_pattern_tokens: tuple
+    input_name_tokens: tuple
+    input_type_tokens: tuple
+    output_name_tokens: tuple
+    output_type_tokens: tuple
+    event_tokens: tuple
+    emitted_events: tuple
+    consumed_events: tuple
+    interface_tokens: tuple
+    io_counts: tuple      # (input count, output count) per card
+    softness: tuple       # fraction of soft assumptions per card
+    swappability: tuple   # fraction of swappable adaptation points per card
+    ap_counts: tuple      # adaptation point count per card
+
+
+def build_registry_index(cards) -> RegistryIndex:
+    """Prepare all cards once and transpose them into columns."""
+    prepared = tuple(_prepare_cached(c) for c in cards)
+
+    def column(attr):
+        return tuple(getattr(p, attr) for p in prepared)
+
+    return RegistryIndex(
+        prepared=prepared,
+        names=tuple(p.parsed.name for p in prepared),
+        sub_patterns=column("sub_patterns"),
+        sub_pattern_tokens=column("sub_pattern_tokens"),
+        input_name_tokens=column("input_name_tokens"),
+        input_type_tokens=column("input_type_tokens"),
+        output_name_tokens=column("output_name_tokens"),
+        output_type_tokens=column("output_type_tokens"),
+        event_tokens=column("event_tokens"),
+        emitted_events=column("emitted_events"),
+        consumed_events=column("consumed_events"),
+        interface_tokens=column("interface_tokens"),
+        io_counts=tuple((len(p.parsed.input_names), len(p.parsed.output_names))
+                        for p in prepared),
+        softness=column("softness"),
+        swappability=column("swappability"),
+        ap_counts=column("ap_count"),
+    )
+
+
+def adaptation_portability_matrix(index: RegistryIndex) -> list:
+    """All-pairs adaptation-portability matrix over a registry index.
+
+    Batch form of compute_adaptation_portability over the precomputed
+    scalar columns; symmetry fills both triangles from one pass. The
+    arithmetic mirrors the pairwise kernel operation for operation so
+    the two paths agree bit for bit.
+    """
+    softness, swappability = index.softness, index.swappability
+    ap_counts = index.ap_counts
+    n = len(ap_counts)
+    matrix = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        soft_i, swap_i, ap_i, row_i = (
+            softness[i], swappability[i], ap_counts[i], matrix[i])
+        for j in range(i, n):
+            score = (0.35 * ((soft_i + softness[j]) / 2)
+                     + 0.40 * ((swap_i + swappability[j]) / 2)
+                     + 0.25 * min((ap_i + ap_counts[j]) / 8, 1.0))
+            row_i[j] = matrix[j][i] = score
+    return matrix
+
+
+# prepare() results keyed by the card dict's id(). Card dicts aren't
+# hashable, so the entry holds the dict itself — that both pins the id
+# and lets a hit verify it still refers to the same object. One entry
+# per distinct card, so repeated pairwise comparisons parse each card
+# exactly once.
+_prepare_cache: dict = {}
+
+
+def _prepare_cached(card_data: dict) -> PreparedCard:
+    hit = _prepare_cache.get(id(card_data))
+    if hit is not None and hit[0] is card_data:
+        return hit[1]
+    prepared = prepare(card_data)
+    _prepare_cache[id(card_data)] = (card_data, prepared)
+    return prepared
+
+
 # =============================================================================
 # SIMILARITY COMPUTATIONS (Non-LLM dimensions)
 # =============================================================================
 
 def jaccard_similarity(set_a: set, set_b: set) -> float:
-    """Jaccard index between two sets."""
+    """Jaccard index between two sets.
+
+    Prepared cards go through the bitset form instead; this handles ad
+    hoc sets (e.g. the offline LLM fallback).
+    """
     if not set_a and not set_b:
         return 1.0  # Both empty = identical
     if not set_a or not set_b:
         return 0.0
-    intersection = set_a & set_b
-    union = set_a | set_b
-    return len(intersection) / len(union)
+    # |A u B| = |A| + |B| - |A n B|: no union set is materialized
+    intersection = len(set_a & set_b)
+    return intersection / (len(set_a) + len(set_b) - intersection)
 
 
 def normalized_token_overlap(list_a: list, list_b: list) -> float:
@@ -226,135 +529,94 @@ def normalized_token_overlap(list_a: list, list_b: list) -> float:
     Splits each string into tokens and computes Jaccard on the token sets.
     More flexible than exact string matching.
     """
-    def tokenize(strings):
-        tokens = set()
-        for s in strings:
-            # Split on non-alphanumeric, lowercase
-            words = re.findall(r'[a-z]+', s.lower())
-            tokens.update(words)
-        return tokens
-
-    tokens_a = tokenize(list_a)
-    tokens_b = tokenize(list_b)
-    return jaccard_similarity(tokens_a, tokens_b)
+    return jaccard_similarity(_tokenize(list_a), _tokenize(list_b))
 
 
-def compute_sub_pattern_overlap(card_a: ParsedCard, card_b: ParsedCard) -> float:
+def compute_sub_pattern_overlap(card_a: PreparedCard, card_b: PreparedCard) -> float:
     """Dimension 2: Sub-pattern structural overlap."""
-    set_a = set(card_a.sub_patterns)
-    set_b = set(card_b.sub_patterns)
-
     # Exact match Jaccard
-    exact = jaccard_similarity(set_a, set_b)
+    exact = _bitset_jaccard(card_a.sub_patterns, card_b.sub_patterns)
 
     # Token-level similarity (catches partial matches like
     # "demand-forecasting-under-uncertainty" vs "forecasting-with-uncertainty")
-    token = normalized_token_overlap(card_a.sub_patterns, card_b.sub_patterns)
+    token = _bitset_jaccard(card_a.sub_pattern_tokens, card_b.sub_pattern_tokens)
 
     # Blend: weight token overlap higher since exact matches are rare across domains
-    return round(0.4 * exact + 0.6 * token, 3)
+    return 0.4 * exact + 0.6 * token
 
 
-def compute_io_similarity(card_a: ParsedCard, card_b: ParsedCard) -> float:
+def compute_io_similarity(card_a: PreparedCard, card_b: PreparedCard) -> float:
     """Dimension 3: Input/output structural compatibility."""
-    # Compare input names (token overlap)
-    input_name_sim = normalized_token_overlap(card_a.input_names, card_b.input_names)
-
-    # Compare input types (token overlap)
-    input_type_sim = normalized_token_overlap(card_a.input_types, card_b.input_types)
-
-    # Compare output names
-    output_name_sim = normalized_token_overlap(card_a.output_names, card_b.output_names)
-
-    # Compare output types
-    output_type_sim = normalized_token_overlap(card_a.output_types, card_b.output_types)
+    # Token overlap on names and types, all precomputed at prepare() time
+    input_name_sim = _bitset_jaccard(card_a.input_name_tokens, card_b.input_name_tokens)
+    input_type_sim = _bitset_jaccard(card_a.input_type_tokens, card_b.input_type_tokens)
+    output_name_sim = _bitset_jaccard(card_a.output_name_tokens, card_b.output_name_tokens)
+    output_type_sim = _bitset_jaccard(card_a.output_type_tokens, card_b.output_type_tokens)
 
     # Count similarity (similar number of inputs/outputs suggests similar complexity)
-    count_diff = abs(len(card_a.input_names) - len(card_b.input_names)) + \
-                 abs(len(card_a.output_names) - len(card_b.output_names))
-    max_count = max(len(card_a.input_names) + len(card_a.output_names),
-                    len(card_b.input_names) + len(card_b.output_names), 1)
+    a, b = card_a.parsed, card_b.parsed
+    count_diff = abs(len(a.input_names) - len(b.input_names)) + \
+                 abs(len(a.output_names) - len(b.output_names))
+    max_count = max(len(a.input_names) + len(a.output_names),
+                    len(b.input_names) + len(b.output_names), 1)
     count_sim = 1.0 - (count_diff / max_count)
 
-    return round(
+    return (
         0.25 * input_name_sim +
         0.15 * input_type_sim +
         0.25 * output_name_sim +
         0.15 * output_type_sim +
-        0.20 * count_sim,
-        3
+        0.20 * count_sim
     )
 
 
-def compute_adaptation_portability(card_a: ParsedCard, card_b: ParsedCard) -> float:
+def compute_adaptation_portability(card_a: PreparedCard, card_b: PreparedCard) -> float:
     """
     Dimension 5: How much adaptation would be needed?
 
     Looks at the ratio of hard vs soft assumptions and the number/type
     of adaptation points. More swappable components = easier to port.
+    The per-card fractions are folded to scalars at prepare() time, so
+    each pair is three adds and a min.
     """
-    # What fraction of assumptions are "soft" (easier to adapt)?
-    a_soft = sum(1 for s in card_a.assumption_strengths.values() if s == "soft")
-    a_total = max(len(card_a.assumption_strengths), 1)
-    a_softness = a_soft / a_total
-
-    b_soft = sum(1 for s in card_b.assumption_strengths.values() if s == "soft")
-    b_total = max(len(card_b.assumption_strengths), 1)
-    b_softness = b_soft / b_total
-
     # Average softness — higher = more portable
-    avg_softness = (a_softness + b_softness) / 2
+    avg_softness = (card_a.softness + card_b.softness) / 2
 
     # What fraction of adaptation points are swappable (vs just configurable)?
-    a_swappable = sum(1 for t in card_a.adaptation_point_types.values()
-                      if t == "swappable_component")
-    a_ap_total = max(len(card_a.adaptation_point_types), 1)
-
-    b_swappable = sum(1 for t in card_b.adaptation_point_types.values()
-                      if t == "swappable_component")
-    b_ap_total = max(len(card_b.adaptation_point_types), 1)
-
-    swappability = ((a_swappable / a_ap_total) + (b_swappable / b_ap_total)) / 2
+    swappability = (card_a.swappability + card_b.swappability) / 2
 
     # More adaptation points = more designed-for-portability
-    ap_count_score = min((len(card_a.adaptation_point_ids) +
-                          len(card_b.adaptation_point_ids)) / 8, 1.0)
+    ap_count_score = min((card_a.ap_count + card_b.ap_count) / 8, 1.0)
 
-    return round(
+    return (
         0.35 * avg_softness +
         0.40 * swappability +
-        0.25 * ap_count_score,
-        3
+        0.25 * ap_count_score
     )
 
 
-def compute_composition_compatibility(card_a: ParsedCard, card_b: ParsedCard) -> float:
+def compute_composition_compatibility(card_a: PreparedCard, card_b: PreparedCard) -> float:
     """Dimension 6: Can they plug into the same ecosystem?"""
     # Event overlap (do they speak the same event language?)
-    all_events_a = set(card_a.emitted_events + card_a.consumed_events)
-    all_events_b = set(card_b.emitted_events + card_b.consumed_events)
-    event_overlap = normalized_token_overlap(list(all_events_a), list(all_events_b))
+    event_overlap = _bitset_jaccard(card_a.event_tokens, card_b.event_tokens)
 
     # Do they emit events the other consumes? (direct composability)
-    a_emits = set(card_a.emitted_events)
-    b_consumes = set(card_b.consumed_events)
-    b_emits = set(card_b.emitted_events)
-    a_consumes = set(card_a.consumed_events)
-
-    direct_a_to_b = len(a_emits & b_consumes) / max(len(b_consumes), 1)
-    direct_b_to_a = len(b_emits & a_consumes) / max(len(a_consumes), 1)
+    # The divisors are per-card constants stored at prepare() time.
+    direct_a_to_b = ((card_a.emitted_events & card_b.consumed_events).bit_count()
+                     / card_b.consumed_len)
+    direct_b_to_a = ((card_b.emitted_events & card_a.consumed_events).bit_count()
+                     / card_a.consumed_len)
     direct_composability = max(direct_a_to_b, direct_b_to_a)
 
     # Delegate interface overlap
-    interface_overlap = normalized_token_overlap(
-        card_a.delegate_interfaces, card_b.delegate_interfaces
+    interface_overlap = _bitset_jaccard(
+        card_a.interface_tokens, card_b.interface_tokens
     )
 
-    return round(
+    return (
         0.40 * event_overlap +
         0.35 * direct_composability +
-        0.25 * interface_overlap,
-        3
+        0.25 * interface_overlap
     )
 
 
@@ -362,8 +624,16 @@ def compute_composition_compatibility(card_a: ParsedCard, card_b: ParsedCard) ->
 # LLM-POWERED DIMENSIONS (using Claude API)
 # =============================================================================
 
+def _offline_text_similarity(text_a: str, text_b: str) -> float:
+    """Synchronous mirror of compute_llm_similarity's no-key fallback."""
+    tokens_a = set(_TOKEN_RE.findall(text_a.lower()))
+    tokens_b = set(_TOKEN_RE.findall(text_b.lower()))
+    return jaccard_similarity(tokens_a, tokens_b)
+
+
 async def compute_llm_similarity(text_a: str, text_b: str, dimension: str,
-                                  api_key: Optional[str] = None) -> float:
+                                  api_key: Optional[str] = None,
+                                  client=None) -> float:
     """
     Use Claude to compute semantic similarity between two text descriptions.
 
@@ -373,9 +643,9 @@ async def compute_llm_similarity(text_a: str, text_b: str, dimension: str,
     """
     if not api_key:
         # Fallback to token overlap when no API key
-        tokens_a = set(re.findall(r'[a-z]+', text_a.lower()))
-        tokens_b = set(re.findall(r'[a-z]+', text_b.lower()))
-        return round(jaccard_similarity(tokens_a, tokens_b), 3)
+        tokens_a = set(_TOKEN_RE.findall(text_a.lower()))
+        tokens_b = set(_TOKEN_RE.findall(text_b.lower()))
+        return jaccard_similarity(tokens_a, tokens_b)
 
     import httpx
 
@@ -399,30 +669,42 @@ Scoring guide:
 Respond with ONLY a JSON object: {{"score": 0.XX, "reasoning": "one sentence"}}"""
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "x-api-key": api_key,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json",
-                },
-                json={
-                    "model": "claude-sonnet-4-20250514",
-                    "max_tokens": 150,
-                    "messages": [{"role": "user", "content": prompt}],
-                },
-                timeout=30.0,
-            )
-            data = response.json()
-            text = data["content"][0]["text"]
-            result = json.loads(text)
-            return round(float(result["score"]), 3)
+        if client is None:
+            # One-off call without an engine-managed client
+            async with httpx.AsyncClient() as one_off:
+                return await _post_similarity(one_off, api_key, prompt)
+        return await _post_similarity(client, api_key, prompt)
     except Exception as e:
         print(f"LLM similarity failed ({e}), falling back to token overlap")
-        tokens_a = set(re.findall(r'[a-z]+', text_a.lower()))
-        tokens_b = set(re.findall(r'[a-z]+', text_b.lower()))
-        return round(jaccard_similarity(tokens_a, tokens_b), 3)
+        tokens_a = set(_TOKEN_RE.findall(text_a.lower()))
+        tokens_b = set(_TOKEN_RE.findall(text_b.lower()))
+        return jaccard_similarity(tokens_a, tokens_b)
+
+
+async def _post_similarity(client, api_key: str, prompt: str) -> float:
+    response = await client.post(
+        "https://api.anthropic.com/v1/messages",
+        headers={
+            "x-api-key": api_key,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json",
+        },
+        json={
+            "model": "claude-sonnet-4-20250514",
+            "max_tokens": 150,
+            "messages": [{"role": "user", "content": prompt}],
+        },
+        timeout=30.0,
+    )
+    # orjson parses the API envelope and the model's JSON reply several
+    # times faster than the stdlib; fall back when it isn't installed
+    if orjson is not None:
+        data = orjson.loads(response.content)
+        result = orjson.loads(data["content"][0]["text"])
+    else:
+        data = response.json()
+        result = json.loads(data["content"][0]["text"])
+    return round(float(result["score"]), 3)
 
 
 # =============================================================================
@@ -440,64 +722,298 @@ class ABCSimilarityEngine:
 
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key
-
-    async def compare_async(self, card_a: dict, card_b: dict) -> SimilarityBreakdown:
-        """Compare two behavior cards and return detailed similarity breakdown."""
-        a = parse_card(card_a)
-        b = parse_card(card_b)
-
-        breakdown = SimilarityBreakdown()
-
-        # Dimension 1: Problem pattern (LLM-powered)
-        breakdown.problem_pattern_similarity = await compute_llm_similarity(
-            f"Category: {a.problem_category}\n{a.problem_description}",
-            f"Category: {b.problem_category}\n{b.problem_description}",
-            "abstract problem pattern similarity (ignore domain, focus on the underlying computational/logical pattern)",
-            self.api_key
+        # httpx.AsyncClient per event loop — pooled connections belong
+        # to the loop they were opened under, so a client created in
+        # one asyncio.run() must never be reused in the next
+        self._clients: dict = {}
+        # (text-hash pair, dimension) -> float score, or an in-flight
+        # Future other callers await instead of issuing a duplicate call
+        self._llm_cache: dict = {}
+
+    def _get_client(self):
+        """AsyncClient for the running loop — one TLS handshake reused
+        across every call made under that loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            import httpx
+            client = self._clients[loop] = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=32))
+        return client
+
+    async def aclose(self):
+        """Close the running loop's HTTP client, if one was created."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def _run_and_close(self, coro):
+        """Await coro, then close this loop's client.
+
+        The sync wrappers run each call in a throwaway asyncio.run()
+        loop; the client has to be torn down before that loop is, or
+        its connections leak and can never be used again.
+        """
+        try:
+            return await coro
+        finally:
+            await self.aclose()
+
+    async def _llm_similarity(self, text_a: str, text_b: str,
+                              dimension: str) -> float:
+        """compute_llm_similarity with cross-sweep deduplication.
+
+        The score is symmetric, so the cache key sorts the two content
+        hashes; registry sweeps that pit the same description pairs
+        against each other pay for one HTTPS round trip, and concurrent
+        callers for the same key await the first caller's future.
+        """
+        if not self.api_key:
+            # Offline fallback is pure token math — not worth caching
+            return await compute_llm_similarity(text_a, text_b, dimension)
+
+        hash_a = hashlib.sha256(text_a.encode()).hexdigest()
+        hash_b = hashlib.sha256(text_b.encode()).hexdigest()
+        key = (*sorted((hash_a, hash_b)), dimension)
+
+        hit = self._llm_cache.get(key)
+        if isinstance(hit, float):
+            return hit
+        if hit is not None:
+            return await hit
+
+        future = asyncio.get_running_loop().create_future()
+        self._llm_cache[key] = future
+        try:
+            score = await compute_llm_similarity(
+                text_a, text_b, dimension, self.api_key, self._get_client())
+        except Exception as e:
+            del self._llm_cache[key]
+            future.set_exception(e)
+            raise
+        future.set_result(score)
+        self._llm_cache[key] = score
+        return score
+
+    async def compare_prepared_async(self, a: PreparedCard,
+                                     b: PreparedCard,
+                                     min_score: Optional[float] = None) -> SimilarityBreakdown:
+        """Compare two already-prepared cards.
+
+        This is the inner loop of registry scans — prepare() each card
+        once and reuse it across every pairwise comparison. When
+        ``min_score`` is given, the LLM dimensions are skipped for pairs
+        whose composite provably cannot reach it.
+        """
+        pa, pb = a.parsed, b.parsed
+
+        # Dimensions 2, 3, 5, 6 are computed directly and are cheap
+        sub_pattern_overlap = compute_sub_pattern_overlap(a, b)
+        io_structural_similarity = compute_io_similarity(a, b)
+        adaptation_portability = compute_adaptation_portability(a, b)
+        composition_compatibility = compute_composition_compatibility(a, b)
+
+        if min_score is not None and self.api_key is not None:
+            # Upper-bound the composite by assuming both LLM dimensions
+            # come back at 1.0. If even that bound misses min_score the
+            # pair is rejected regardless, so the two API calls would be
+            # wasted. Offline mode never gates: the fallbacks are cheap
+            # and the results should stay exact.
+            w = SimilarityBreakdown
+            bound = (
+                sub_pattern_overlap * w._W_SUB +
+                io_structural_similarity * w._W_IO +
+                adaptation_portability * w._W_ADAPT +
+                composition_compatibility * w._W_COMPOSE +
+                w._W_PROBLEM + w._W_REASONING
+            )
+            if bound < min_score:
+                return SimilarityBreakdown(
+                    sub_pattern_overlap=sub_pattern_overlap,
+                    io_structural_similarity=io_structural_similarity,
+                    adaptation_portability=adaptation_portability,
+                    composition_compatibility=composition_compatibility,
+                    llm_skipped=True,
+                )
+
+        # Dimensions 1 and 4 (LLM-powered) run concurrently — their
+        # latency is the HTTPS round trip, not compute.
+        problem_pattern_similarity, reasoning_similarity = await asyncio.gather(
+            self._llm_similarity(
+                f"Category: {pa.problem_category}\n{pa.problem_description}",
+                f"Category: {pb.problem_category}\n{pb.problem_description}",
+                "abstract problem pattern similarity (ignore domain, focus on the underlying computational/logical pattern)",
+            ),
+            self._llm_similarity(
+                f"{pa.reasoning_method}: {pa.reasoning_approach}",
+                f"{pb.reasoning_method}: {pb.reasoning_approach}",
+                "reasoning methodology similarity (do they use similar decision-making approaches?)",
+            ),
         )
 
-        # Dimension 2: Sub-pattern overlap (computed)
-        breakdown.sub_pattern_overlap = compute_sub_pattern_overlap(a, b)
-
-        # Dimension 3: I/O structural similarity (computed)
-        breakdown.io_structural_similarity = compute_io_similarity(a, b)
-
-        # Dimension 4: Reasoning approach (LLM-powered)
-        reasoning_a = f"{a.reasoning_method}: {a.reasoning_approach}"
-        reasoning_b = f"{b.reasoning_method}: {b.reasoning_approach}"
-        breakdown.reasoning_similarity = await compute_llm_similarity(
-            reasoning_a, reasoning_b,
-            "reasoning methodology similarity (do they use similar decision-making approaches?)",
-            self.api_key
+        return SimilarityBreakdown(
+            problem_pattern_similarity=problem_pattern_similarity,
+            sub_pattern_overlap=sub_pattern_overlap,
+            io_structural_similarity=io_structural_similarity,
+            reasoning_similarity=reasoning_similarity,
+            adaptation_portability=adaptation_portability,
+            composition_compatibility=composition_compatibility,
         )
 
-        # Dimension 5: Adaptation portability (computed)
-        breakdown.adaptation_portability = compute_adaptation_portability(a, b)
-
-        # Dimension 6: Composition compatibility (computed)
-        breakdown.composition_compatibility = compute_composition_compatibility(a, b)
-
-        return breakdown
+    async def compare_async(self, card_a: dict, card_b: dict) -> SimilarityBreakdown:
+        """Compare two behavior cards and return detailed similarity breakdown."""
+        return await self.compare_prepared_async(_prepare_cached(card_a),
+                                                 _prepare_cached(card_b))
+
+    def compare_offline(self, a: PreparedCard, b: PreparedCard) -> SimilarityBreakdown:
+        """Compare two prepared cards without touching the event loop.
+
+        In offline mode nothing actually awaits, so the async machinery
+        is pure overhead — this is the path the N-squared demo sweep
+        takes, once per pair.
+        """
+        pa, pb = a.parsed, b.parsed
+        return SimilarityBreakdown(
+            problem_pattern_similarity=_offline_text_similarity(
+                f"Category: {pa.problem_category}\n{pa.problem_description}",
+                f"Category: {pb.problem_category}\n{pb.problem_description}"),
+            sub_pattern_overlap=compute_sub_pattern_overlap(a, b),
+            io_structural_similarity=compute_io_similarity(a, b),
+            reasoning_similarity=_offline_text_similarity(
+                f"{pa.reasoning_method}: {pa.reasoning_approach}",
+                f"{pb.reasoning_method}: {pb.reasoning_approach}"),
+            adaptation_portability=compute_adaptation_portability(a, b),
+            composition_compatibility=compute_composition_compatibility(a, b),
+        )
 
     def compare(self, card_a: dict, card_b: dict) -> SimilarityBreakdown:
-        """Synchronous wrapper for compare_async."""
-        return asyncio.run(self.compare_async(card_a, card_b))
+        """Synchronous wrapper; offline mode skips asyncio.run entirely."""
+        if self.api_key is None:
+            return self.compare_offline(_prepare_cached(card_a),
+                                        _prepare_cached(card_b))
+        return asyncio.run(self._run_and_close(
+            self.compare_async(card_a, card_b)))
+
+    def compute_similarity_matrix(self, cards: list) -> list:
+        """All-pairs SimilarityBreakdown matrix for a list of cards.
+
+        Each card is prepared once, then every set-based dimension runs
+        as one batch sweep over the RegistryIndex columns
+        (jaccard_matrix / adaptation_portability_matrix) instead of
+        being re-derived pair by pair. The text dimensions always use
+        the offline token-overlap similarity — an online all-vs-all
+        sweep would cost N*(N-1) API calls; use find_similar_async for
+        that. Row and column order follow `cards`; the matrix is
+        symmetric with self-similarity on the diagonal.
+        """
+        index = build_registry_index(cards)
+        prepared = index.prepared
+        n = len(prepared)
+
+        sub_exact = jaccard_matrix(index.sub_patterns)
+        sub_token = jaccard_matrix(index.sub_pattern_tokens)
+        in_name = jaccard_matrix(index.input_name_tokens)
+        in_type = jaccard_matrix(index.input_type_tokens)
+        out_name = jaccard_matrix(index.output_name_tokens)
+        out_type = jaccard_matrix(index.output_type_tokens)
+        events = jaccard_matrix(index.event_tokens)
+        interfaces = jaccard_matrix(index.interface_tokens)
+        portability = adaptation_portability_matrix(index)
+
+        # Token sets for the offline text dimensions, one per card
+        problem_tokens = []
+        reasoning_tokens = []
+        for p in prepared:
+            pa = p.parsed
+            problem_tokens.append(set(_TOKEN_RE.findall(
+                f"Category: {pa.problem_category}\n{pa.problem_description}".lower())))
+            reasoning_tokens.append(set(_TOKEN_RE.findall(
+                f"{pa.reasoning_method}: {pa.reasoning_approach}".lower())))
+        io_counts = index.io_counts
+
+        matrix = [[None] * n for _ in range(n)]
+        for i in range(n):
+            a = prepared[i]
+            in_i, out_i = io_counts[i]
+            for j in range(i, n):
+                b = prepared[j]
+                in_j, out_j = io_counts[j]
+
+                count_diff = abs(in_i - in_j) + abs(out_i - out_j)
+                max_count = max(in_i + out_i, in_j + out_j, 1)
+                count_sim = 1.0 - (count_diff / max_count)
+                io_sim = (
+                    0.25 * in_name[i][j] +
+                    0.15 * in_type[i][j] +
+                    0.25 * out_name[i][j] +
+                    0.15 * out_type[i][j] +
+                    0.20 * count_sim
+                )
+
+                direct_a_to_b = ((a.emitted_events & b.consumed_events).bit_count()
+                                 / b.consumed_len)
+                direct_b_to_a = ((b.emitted_events & a.consumed_events).bit_count()
+                                 / a.consumed_len)
+                composition = (
+                    0.40 * events[i][j] +
+                    0.35 * max(direct_a_to_b, direct_b_to_a) +
+                    0.25 * interfaces[i][j]
+                )
+
+                matrix[i][j] = matrix[j][i] = SimilarityBreakdown(
+                    problem_pattern_similarity=jaccard_similarity(
+                        problem_tokens[i], problem_tokens[j]),
+                    sub_pattern_overlap=0.4 * sub_exact[i][j] + 0.6 * sub_token[i][j],
+                    io_structural_similarity=io_sim,
+                    reasoning_similarity=jaccard_similarity(
+                        reasoning_tokens[i], reasoning_tokens[j]),
+                    adaptation_portability=portability[i][j],
+                    composition_compatibility=composition,
+                )
+        return matrix
 
     async def find_similar_async(self, card: dict, registry: list[dict],
                                   min_score: float = 0.3,
                                   max_results: int = 10) -> list[dict]:
         """Find similar behaviors in a registry."""
-        results = []
-        for candidate in registry:
-            if candidate.get("identity", {}).get("name") == \
-               card.get("identity", {}).get("name"):
-                continue  # Skip self
+        # Bound the tokenizer cache per scan rather than across runs
+        _tokenize_one.cache_clear()
+        query = prepare(card)
+        query_name = card.get("identity", {}).get("name")
+
+        # MinHash prefilter: the signature match rate approximates the
+        # Jaccard of the combined token sets, so candidates far below
+        # min_score skip the full 6-dimension pipeline (and any LLM
+        # calls) entirely. The margin keeps the estimate conservative.
+        prefilter_floor = min_score * 0.5
+        query_sig = query.minhash
+        candidates = []
+        for c in registry:
+            if c.get("identity", {}).get("name") == query_name:
+                continue
+            sig = _prepare_cached(c).minhash
+            approx = sum(map(int.__eq__, query_sig, sig)) / _MINHASH_WIDTH
+            if approx >= prefilter_floor:
+                candidates.append(c)
+
+        # Score candidates concurrently; the semaphore bounds in-flight
+        # LLM requests while leaving offline scoring unaffected.
+        semaphore = asyncio.Semaphore(8)
+
+        async def score(candidate):
+            async with semaphore:
+                return await self.compare_prepared_async(
+                    query, _prepare_cached(candidate), min_score=min_score)
 
-            breakdown = await self.compare_async(card, candidate)
+        breakdowns = await asyncio.gather(*(score(c) for c in candidates))
+
+        results = []
+        for candidate, breakdown in zip(candidates, breakdowns):
+            identity = candidate.get("identity", {})
             if breakdown.composite_score >= min_score:
                 results.append({
-                    "card": candidate.get("identity", {}).get("name", "unknown"),
-                    "display_name": candidate.get("identity", {}).get("display_name", ""),
+                    "card": identity.get("name", "unknown"),
+                    "display_name": identity.get("display_name", ""),
                     "score": breakdown.composite_score,
                     "breakdown": breakdown.to_dict(),
                     "explanation": breakdown.explanation,
@@ -510,7 +1026,8 @@ class ABCSimilarityEngine:
                      min_score: float = 0.3,
                      max_results: int = 10) -> list[dict]:
         """Synchronous wrapper for find_similar_async."""
-        return asyncio.run(self.find_similar_async(card, registry, min_score, max_results))
+        return asyncio.run(self._run_and_close(
+            self.find_similar_async(card, registry, min_score, max_results)))
 
 
 # =============================================================================
@@ -521,26 +1038,41 @@ if __name__ == "__main__":
     import yaml
     import glob
     import os
+    from concurrent.futures import ThreadPoolExecutor
+
+    try:
+        # libyaml-backed loader, typically 3-5x faster than pure Python
+        from yaml import CSafeLoader as _DemoLoader
+    except ImportError:
+        from yaml import SafeLoader as _DemoLoader
 
     print("=" * 60)
     print("ABC Similarity Engine — Demo")
     print("=" * 60)
     print()
 
-    # Load all cards
+    # Load all cards; threads hide file I/O latency and map() keeps the
+    # sorted order
     card_dir = os.path.join(os.path.dirname(__file__), "cards")
     if not os.path.isdir(card_dir):
         card_dir = "/home/claude/abc-registry-v0.1.0/cards"
 
+    def _load_one(filepath):
+        try:
+            with open(filepath) as f:
+                return filepath, yaml.load(f, Loader=_DemoLoader), None
+        except Exception as e:
+            return filepath, None, e
+
     cards = {}
-    for filepath in sorted(glob.glob(os.path.join(card_dir, "*.yaml"))):
-        with open(filepath) as f:
-            try:
-                card = yaml.safe_load(f)
-                name = card.get("identity", {}).get("name", os.path.basename(filepath))
-                cards[name] = card
-            except Exception as e:
-                print(f"  Skipping {filepath}: {e}")
+    with ThreadPoolExecutor() as executor:
+        for filepath, card, error in executor.map(
+                _load_one, sorted(glob.glob(os.path.join(card_dir, "*.yaml")))):
+            if error is not None:
+                print(f"  Skipping {filepath}: {error}")
+                continue
+            name = card.get("identity", {}).get("name", os.path.basename(filepath))
+            cards[name] = card
 
     print(f"Loaded {len(cards)} cards")
     print()
@@ -571,20 +1103,15 @@ if __name__ == "__main__":
     print("=" * 60)
     print()
 
-    compared = set()
-    results = []
+    # One batch sweep over the registry instead of N² engine.compare calls
+    matrix = engine.compute_similarity_matrix(list(cards.values()))
 
-    for name_a in available_names:
-        for name_b in available_names:
+    results = []
+    for i, name_a in enumerate(available_names):
+        for j, name_b in enumerate(available_names):
             if name_a >= name_b:
                 continue
-            pair_key = (name_a, name_b)
-            if pair_key in compared:
-                continue
-            compared.add(pair_key)
-
-            breakdown = engine.compare(cards[name_a], cards[name_b])
-            results.append((name_a, name_b, breakdown))
+            results.append((name_a, name_b, matrix[i][j]))
 
     # Sort by composite score
     results.sort(key=lambda x: x[2].composite_score, reverse=True)